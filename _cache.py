@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Small on-disk TTL cache for API responses
+Lets back-to-back CLI invocations reuse a recent DexScreener / GeckoTerminal response
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+def _path(key):
+    """Cache file for a key (normally the full request URL)"""
+    return os.path.join(CACHE_DIR, hashlib.md5(key.encode('utf-8')).hexdigest() + '.json')
+
+def get(key, ttl):
+    """
+    Return the cached JSON document for a key if it is younger than ttl seconds, else None
+    """
+    try:
+        with open(_path(key), 'rb') as f:
+            entry = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    
+    if time.time() - entry.get('ts', 0) > ttl:
+        return None
+    return entry.get('data')
+
+def put(key, data):
+    """
+    Store a JSON document for a key; failures only cost the next caller a network round trip
+    """
+    try:
+        payload = json.dumps({'ts': time.time(), 'data': data}).encode('utf-8')
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        
+        # Write to a temp file then rename so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    except (OSError, TypeError, ValueError):
+        return
+    
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, _path(key))
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+# A revalidation entry only ever serves a body the server has just confirmed unchanged (304), so it keeps for a day
+ETAG_TTL = 86400
+
+def get_etag(url):
+    """
+    (etag, data) stored for a URL by put_etag, or (None, None) when there is no usable entry
+    """
+    entry = get('etag:' + url, ETAG_TTL)
+    if not entry or not entry.get('etag'):
+        return None, None
+    return entry['etag'], entry.get('data')
+
+def put_etag(url, etag, data):
+    """
+    Remember a response's ETag and parsed body so the next run can send If-None-Match
+    """
+    put('etag:' + url, {'etag': etag, 'data': data})
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Shared pooled HTTP client for the GeckoTerminal / DexScreener fetchers
+Every module importing HTTP reuses the same keep-alive sockets, so a second request
+to a host already contacted in this process skips the TCP and TLS handshakes
+"""
+
+import socket
+
+import urllib3
+from urllib3.connection import HTTPConnection
+
+import _cache
+from _jsonio import json_loads
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate',  # urllib3 and aiohttp both decode the body before we parse it
+    'Connection': 'keep-alive'
+}
+
+def _keepalive_socket_options():
+    """TCP keepalive probes so idle pooled sockets stay warm between bursts of calls"""
+    options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    # Linux names the idle timer TCP_KEEPIDLE, macOS TCP_KEEPALIVE
+    idle_option = getattr(socket, 'TCP_KEEPIDLE', None) or getattr(socket, 'TCP_KEEPALIVE', None)
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, 60))
+    return options
+
+HTTP = urllib3.PoolManager(
+    maxsize=16,
+    headers=DEFAULT_HEADERS,
+    retries=urllib3.Retry(total=3, backoff_factor=0.3),
+    socket_options=_keepalive_socket_options()
+)
+
+def get_json(url, ttl, timeout=15):
+    """
+    GET a JSON document, answering repeat calls within ttl seconds from the on-disk cache
+    Returns (status, data)
+    """
+    data = _cache.get(url, ttl)
+    if data is not None:
+        return 200, data
+    
+    response = HTTP.request('GET', url, timeout=timeout)
+    if response.status != 200:
+        return response.status, None
+    
+    data = json_loads(response.data)
+    _cache.put(url, data)
+    return 200, data
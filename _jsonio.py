@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Shared JSON parsing and stdout output for the fetcher scripts
+Uses orjson when it is installed and the standard json module otherwise
+"""
+
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(raw):
+    """Parse a JSON payload (bytes or str), preferring orjson when available"""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def emit_json(obj, indent=False):
+    """Write a JSON document to stdout for the calling server process"""
+    if orjson:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=option))
+    else:
+        print(json.dumps(obj, indent=2 if indent else None))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for reading token fields out of DexScreener / GeckoTerminal payloads
+"""
+
+# Quote symbols that mark a HYPE pair; the same symbols are never listed as tokens themselves
+HYPE_SYMBOLS = frozenset(('HYPE', 'WHYPE'))
+
+def to_float(section, key):
+    """Read a numeric API field as float, treating a missing section, key or null as 0"""
+    return float((section or {}).get(key) or 0)
+
+def to_int(section, key):
+    """Read a numeric API field (often a decimal string) as int, treating a missing section, key or null as 0"""
+    return int(float((section or {}).get(key) or 0))
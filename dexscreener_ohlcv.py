@@ -4,12 +4,40 @@ Real DexScreener OHLCV candlestick data fetcher
 Gets authentic chart data directly from DexScreener API endpoints
 """
 
-import json
+import asyncio
+import functools
+import importlib.util
+import logging
 import sys
 import time
-import subprocess
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import _cache
+from _jsonio import emit_json, json_loads
+
+logger = logging.getLogger(__name__)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# HTTP/2 multiplexing needs the optional h2 package alongside httpx
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Shared keep-alive session so repeated DexScreener calls reuse one TLS connection
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json'
+}
+_SESSION = requests.Session()
+_SESSION.headers.update(_DEFAULT_HEADERS)
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
 
 def fetch_dexscreener_ohlcv(token_address, timeframe='5m', limit=100):
     """
@@ -24,41 +52,89 @@ def fetch_dexscreener_ohlcv(token_address, timeframe='5m', limit=100):
         Real OHLCV candlestick data from DexScreener
     """
     try:
-        # DexScreener pairs API endpoint
-        pairs_url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        }
+        url = _pairs_url(token_address)
+        response = _SESSION.get(url, headers=_revalidation_headers(url), timeout=15)
+        status, data = _read_pairs_response(url, response)
+        return _chart_from_pairs_response(status, data, token_address, timeframe, limit)
         
-        request = Request(pairs_url, headers=headers)
+    except (requests.RequestException, ValueError) as e:
+        logger.error("DexScreener API error: %s", e)
         
-        with urlopen(request, timeout=15) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode('utf-8'))
-                
-                if 'pairs' in data and data['pairs']:
-                    # Get the most liquid pair for accurate data
-                    best_pair = max(data['pairs'], key=lambda p: float(p.get('liquidity', {}).get('usd', 0) or 0))
-                    
-                    print(f"✅ Found DexScreener pair: {best_pair.get('baseToken', {}).get('symbol', 'UNKNOWN')}", file=sys.stderr)
-                    
-                    # Try to get chart data from DexScreener charts API
-                    pair_address = best_pair.get('pairAddress')
-                    if pair_address:
-                        return fetch_pair_chart_data(pair_address, timeframe, limit, best_pair)
-                        
-                else:
-                    print(f"❌ No pairs found for token {token_address}", file=sys.stderr)
-                    
-            else:
-                print(f"❌ DexScreener API error: HTTP {response.status}", file=sys.stderr)
+    return None
+
+async def fetch_one(client, token_address, timeframe='5m', limit=100):
+    """
+    Async variant of fetch_dexscreener_ohlcv that reuses a shared httpx.AsyncClient
+    """
+    try:
+        url = _pairs_url(token_address)
+        response = await client.get(url, headers=_revalidation_headers(url))
+        status, data = _read_pairs_response(url, response)
+        return _chart_from_pairs_response(status, data, token_address, timeframe, limit)
+        
+    except (httpx.HTTPError, ValueError) as e:
+        logger.error("DexScreener API error: %s", e)
+        
+    return None
+
+async def fetch_all(token_addresses, timeframe='5m', limit=100):
+    """
+    Fetch OHLCV data for several tokens concurrently over one pooled (HTTP/2 when available) client
+    """
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    async with httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=limits, timeout=15.0, headers=_DEFAULT_HEADERS) as client:
+        return await asyncio.gather(*[fetch_one(client, address, timeframe, limit) for address in token_addresses])
+
+def _pairs_url(token_address):
+    """DexScreener pairs API endpoint for a token"""
+    return f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+
+def _revalidation_headers(url):
+    """If-None-Match header for a URL we already hold an ETag for"""
+    etag, _ = _cache.get_etag(url)
+    return {'If-None-Match': etag} if etag else {}
+
+def _read_pairs_response(url, response):
+    """
+    Parse a pairs response (requests or httpx), reusing the cached document on 304 Not Modified
+    Returns (status, data)
+    """
+    if response.status_code == 304:
+        _, cached = _cache.get_etag(url)
+        if cached is not None:
+            return 200, cached
+    if response.status_code != 200:
+        return response.status_code, None
+    
+    data = json_loads(response.content)
+    etag = response.headers.get('ETag')
+    if etag:
+        _cache.put_etag(url, etag, data)
+    return 200, data
+
+def _chart_from_pairs_response(status, data, token_address, timeframe, limit):
+    """
+    Turn a parsed DexScreener pairs response into chart data using its most liquid pair
+    """
+    if status == 200:
+        if 'pairs' in data and data['pairs']:
+            # Get the most liquid pair for accurate data (liquidity coerced once per pair)
+            pairs = data['pairs']
+            liquidities = [float((p.get('liquidity') or {}).get('usd') or 0) for p in pairs]
+            best_pair = pairs[max(range(len(liquidities)), key=liquidities.__getitem__)]
+            
+            logger.info("✅ Found DexScreener pair: %s", best_pair.get('baseToken', {}).get('symbol', 'UNKNOWN'))
+            
+            # Try to get chart data from DexScreener charts API
+            pair_address = best_pair.get('pairAddress')
+            if pair_address:
+                return fetch_pair_chart_data(pair_address, timeframe, limit, best_pair)
                 
-    except (URLError, HTTPError, json.JSONDecodeError) as e:
-        print(f"DexScreener API error: {e}", file=sys.stderr)
+        else:
+            logger.warning("❌ No pairs found for token %s", token_address)
+            
+    else:
+        logger.error("❌ DexScreener API error: HTTP %s", status)
         
     return None
 
@@ -73,163 +149,248 @@ def fetch_pair_chart_data(pair_address, timeframe, limit, pair_info):
         price_change_24h = float(pair_info.get('priceChange', {}).get('h24', 0) or 0)
         
         if current_price <= 0:
-            print(f"❌ Invalid price data from DexScreener", file=sys.stderr)
+            logger.warning("❌ Invalid price data from DexScreener")
             return None
         
-        print(f"📊 DexScreener data: Price=${current_price:.8f}, Volume=${volume_24h:.0f}, Change={price_change_24h:.2f}%", file=sys.stderr)
+        logger.info("📊 DexScreener data: Price=$%.8f, Volume=$%.0f, Change=%.2f%%", current_price, volume_24h, price_change_24h)
         
         # Generate realistic OHLCV based on DexScreener data
         return generate_dexscreener_realistic_ohlcv(pair_info, timeframe, limit)
         
     except Exception as e:
-        print(f"Error fetching pair chart data: {e}", file=sys.stderr)
+        logger.error("Error fetching pair chart data: %s", e)
         return None
 
-def generate_dexscreener_realistic_ohlcv(pair_info, timeframe, limit):
+def _gen_candles(noise, wick_high_r, wick_low_r, vol_var, trend, start_price, interval_volume, spike_mask):
     """
-    Generate authentic-looking OHLCV data based on real DexScreener pair data
-    Uses actual market metrics from DexScreener for realistic patterns
+    Walk the candle recurrence (each open is the previous close) over plain Python floats
+    Returns (open, high, low, close, volume) arrays
     """
-    timeframe_config = {
-        '1m': {'seconds': 60, 'volatility': 0.015, 'trend_factor': 0.003},
-        '5m': {'seconds': 300, 'volatility': 0.035, 'trend_factor': 0.008},
-        '15m': {'seconds': 900, 'volatility': 0.055, 'trend_factor': 0.015},
-        '1h': {'seconds': 3600, 'volatility': 0.085, 'trend_factor': 0.030},
-        '4h': {'seconds': 14400, 'volatility': 0.140, 'trend_factor': 0.055},
-        '1d': {'seconds': 86400, 'volatility': 0.200, 'trend_factor': 0.090}
-    }
-    
-    config = timeframe_config.get(timeframe, timeframe_config['5m'])
-    
-    # Real DexScreener data
-    current_price = float(pair_info.get('priceUsd', 0))
-    volume_24h = float(pair_info.get('volume', {}).get('h24', 0) or 50000)
-    price_change_24h = float(pair_info.get('priceChange', {}).get('h24', 0) or 0)
-    liquidity_usd = float(pair_info.get('liquidity', {}).get('usd', 100000) or 100000)
+    open_list, high_list, low_list, close_list, vol_list = [], [], [], [], []
     
-    current_time = int(time.time())
-    candles = []
-    
-    # Calculate trend direction from 24h change
-    trend_direction = 1 if price_change_24h > 0 else -1
-    trend_strength = min(abs(price_change_24h) / 100, 0.5)  # Cap at 50%
-    
-    # Start from a price that would result in current price after trend
-    start_price = current_price / (1 + (price_change_24h / 100) * 0.8)
     prev_close = start_price
+    for noise_i, high_r, low_r, vol_r, trend_i, spike in zip(
+        noise.tolist(), wick_high_r.tolist(), wick_low_r.tolist(),
+        vol_var.tolist(), trend.tolist(), spike_mask.tolist()
+    ):
+        # Volume-based volatility spikes
+        market_noise = noise_i * 2.5 if spike else noise_i
+        
+        open_price = prev_close
+        price_movement = open_price * (market_noise + trend_i)
+        close_price = open_price + price_movement
+        
+        # Realistic wick patterns based on volatility
+        wick_range = abs(price_movement) * 2.2
+        body_high = max(open_price, close_price)
+        body_low = min(open_price, close_price)
+        high_price = body_high + high_r * wick_range
+        low_price = body_low - low_r * wick_range
+        
+        # Ensure prices stay positive
+        if low_price <= 0:
+            low_price = body_low * 0.85
+        
+        volume = int(interval_volume * vol_r)
+        if spike:
+            volume *= 3
+        
+        open_list.append(open_price)
+        high_list.append(high_price)
+        low_list.append(low_price)
+        close_list.append(close_price)
+        vol_list.append(volume)
+        prev_close = close_price
     
-    for i in range(limit - 1, -1, -1):
-        timestamp = current_time - (i * config['seconds'])
+    return (np.array(open_list, dtype=np.float64), np.array(high_list, dtype=np.float64),
+            np.array(low_list, dtype=np.float64), np.array(close_list, dtype=np.float64),
+            np.array(vol_list, dtype=np.int64))
+
+_TIMEFRAME_CONFIG = {
+    '1m': {'seconds': 60, 'volatility': 0.015, 'trend_factor': 0.003},
+    '5m': {'seconds': 300, 'volatility': 0.035, 'trend_factor': 0.008},
+    '15m': {'seconds': 900, 'volatility': 0.055, 'trend_factor': 0.015},
+    '1h': {'seconds': 3600, 'volatility': 0.085, 'trend_factor': 0.030},
+    '4h': {'seconds': 14400, 'volatility': 0.140, 'trend_factor': 0.055},
+    '1d': {'seconds': 86400, 'volatility': 0.200, 'trend_factor': 0.090}
+}
+
+@functools.lru_cache(maxsize=8)
+def _mk_generator(timeframe):
+    """
+    Build a candle generator specialised for one timeframe
+    The timeframe constants are bound into the closure once instead of looked up per call
+    """
+    config = _TIMEFRAME_CONFIG.get(timeframe, _TIMEFRAME_CONFIG['5m'])
+    seconds, volatility, trend_factor = config['seconds'], config['volatility'], config['trend_factor']
+    intervals_per_day = 24 * 3600 / seconds
+    interval_ms = seconds * 1000
+    
+    def gen(pair_info, limit):
+        # Real DexScreener data
+        current_price = float(pair_info.get('priceUsd', 0))
+        volume_24h = float(pair_info.get('volume', {}).get('h24', 0) or 50000)
+        price_change_24h = float(pair_info.get('priceChange', {}).get('h24', 0) or 0)
+        liquidity_usd = float(pair_info.get('liquidity', {}).get('usd', 100000) or 100000)
+        
+        now_ms = time.time_ns() // 1_000_000
+        
+        # Calculate trend direction from 24h change
+        trend_direction = 1 if price_change_24h > 0 else -1
+        trend_strength = min(abs(price_change_24h) / 100, 0.5)  # Cap at 50%
+        
+        # Start from a price that would result in current price after trend
+        start_price = current_price / (1 + (price_change_24h / 100) * 0.8)
         
         # Real market patterns based on DexScreener data
         liquidity_factor = min(liquidity_usd / 100000, 5.0)  # Higher liquidity = lower volatility
-        volatility_adjustment = config['volatility'] / liquidity_factor
+        volatility_adjustment = volatility / liquidity_factor
+        interval_volume = volume_24h / intervals_per_day
+        
+        # One row per candle, oldest first, as JavaScript (millisecond) timestamps
+        timestamps_ms = now_ms - np.arange(limit - 1, -1, -1, dtype=np.int64) * interval_ms
+        
+        # All per-candle randomness comes from one seeded generator, drawn as whole arrays
+        rng = np.random.default_rng(now_ms)
         
         # Market noise with DexScreener-based patterns
-        market_noise = (hash(str(timestamp)) % 2000 - 1000) / 50000 * volatility_adjustment
+        market_noise = rng.integers(-1000, 1000, size=limit) / 50000 * volatility_adjustment
         
         # Apply 24h trend progressively
-        progress = (limit - i) / limit
-        trend_component = trend_direction * trend_strength * progress * config['trend_factor']
+        progress = np.arange(1, limit + 1) / limit
+        trend_component = trend_direction * trend_strength * progress * trend_factor
         
         # Volume-based volatility spikes
-        volume_spike = (hash(str(timestamp + 12345)) % 100) < 15  # 15% chance
-        if volume_spike:
-            market_noise *= 2.5
+        volume_spike = rng.random(limit) < 0.15  # 15% chance
         
-        # Calculate OHLC based on real market behavior
-        open_price = prev_close
-        price_movement = open_price * (market_noise + trend_component)
-        close_price = open_price + price_movement
+        # Wick and volume randomness drawn up front; the price path itself is sequential
+        wick_high_r = rng.random(limit)
+        wick_low_r = rng.random(limit)
+        volume_variation = rng.random(limit) * 1.5  # 0x to 1.5x variation
         
-        # Realistic wick patterns based on volatility
-        wick_range = abs(price_movement) * 2.2
-        high_wick = (hash(str(timestamp + 99999)) % 100) / 100 * wick_range
-        low_wick = (hash(str(timestamp + 88888)) % 100) / 100 * wick_range
+        open_prices, high_prices, low_prices, close_prices, volumes = _gen_candles(
+            market_noise, wick_high_r, wick_low_r, volume_variation, trend_component,
+            start_price, interval_volume, volume_spike
+        )
         
-        high_price = max(open_price, close_price) + high_wick
-        low_price = min(open_price, close_price) - low_wick
+        # Direction is decided on the unrounded prices, then every price column is rounded in place
+        direction = np.where(close_prices >= open_prices, 'up', 'down').tolist()
+        for column in (open_prices, high_prices, low_prices, close_prices):
+            np.round(column, 8, out=column)
         
-        # Ensure prices stay positive
-        if low_price <= 0:
-            low_price = min(open_price, close_price) * 0.85
-        
-        # Volume calculation based on DexScreener 24h volume
-        interval_volume = volume_24h / (24 * 3600 / config['seconds'])
-        volume_variation = (hash(str(timestamp + 54321)) % 150) / 100  # 0.5x to 2x variation
-        volume = int(interval_volume * volume_variation)
+        # .tolist() hands back plain Python ints/floats in one C pass, so no per-field conversion is needed
+        candles = [
+            {
+                'timestamp': ts,  # JavaScript timestamp
+                'open': o,
+                'high': h,
+                'low': l,
+                'close': c,
+                'volume': v,
+                'direction': side
+            }
+            for ts, o, h, l, c, v, side in zip(
+                timestamps_ms.tolist(), open_prices.tolist(), high_prices.tolist(),
+                low_prices.tolist(), close_prices.tolist(), volumes.tolist(), direction
+            )
+        ]
         
-        if volume_spike:
-            volume *= 3
+        # Calculate price range straight from the (rounded) price arrays
+        price_min = float(low_prices.min())
+        price_max = float(high_prices.max())
         
-        candle = {
-            'timestamp': timestamp * 1000,  # JavaScript timestamp
-            'open': round(open_price, 8),
-            'high': round(high_price, 8),
-            'low': round(low_price, 8),
-            'close': round(close_price, 8),
-            'volume': int(volume),
-            'direction': 'up' if close_price >= open_price else 'down'
+        return {
+            'success': True,
+            'candlesticks': candles,
+            'priceRange': {
+                'min': price_min,
+                'max': price_max
+            },
+            'currentPrice': candles[-1]['close'] if candles else current_price,
+            'timeframe': timeframe,
+            'symbol': pair_info.get('baseToken', {}).get('symbol', 'UNKNOWN'),
+            'source': 'DexScreener_Real_Data',
+            'pair_address': pair_info.get('pairAddress'),
+            'dex': pair_info.get('dexId', 'unknown')
         }
-        
-        candles.append(candle)
-        prev_close = close_price
     
-    # Calculate price range
-    all_prices = []
-    for candle in candles:
-        all_prices.extend([candle['high'], candle['low']])
-    
-    return {
-        'success': True,
-        'candlesticks': candles,
-        'priceRange': {
-            'min': min(all_prices),
-            'max': max(all_prices)
-        },
-        'currentPrice': candles[-1]['close'] if candles else current_price,
-        'timeframe': timeframe,
-        'symbol': pair_info.get('baseToken', {}).get('symbol', 'UNKNOWN'),
-        'source': 'DexScreener_Real_Data',
-        'pair_address': pair_info.get('pairAddress'),
-        'dex': pair_info.get('dexId', 'unknown')
-    }
+    return gen
+
+def generate_dexscreener_realistic_ohlcv(pair_info, timeframe, limit):
+    """
+    Generate authentic-looking OHLCV data based on real DexScreener pair data
+    Uses actual market metrics from DexScreener for realistic patterns
+    """
+    return _mk_generator(timeframe)(pair_info, limit)
+
+# Known HyperEVM token addresses (would need real addresses)
+_KNOWN_ADDRS = {
+    'BUDDY': '0x123...abc',  # Need real BUDDY contract address
+    'RUB': '0x456...def',    # Need real RUB contract address
+    'LHYPE': '0x789...ghi',  # Need real LHYPE contract address
+}
 
 def find_token_address(symbol):
     """
     Find the token contract address for a given symbol
     """
-    # Known HyperEVM token addresses (would need real addresses)
-    known_addresses = {
-        'BUDDY': '0x123...abc',  # Need real BUDDY contract address
-        'RUB': '0x456...def',    # Need real RUB contract address
-        'LHYPE': '0x789...ghi',  # Need real LHYPE contract address
-    }
+    return _KNOWN_ADDRS.get(symbol.upper())
+
+def fetch_symbols(symbols, timeframe='5m', limit=60):
+    """
+    Fetch OHLCV data for several symbols in one batch, keyed by symbol
+    Requests run concurrently through fetch_all when httpx is installed
+    """
+    addresses = {symbol: find_token_address(symbol) for symbol in symbols}
+    known_symbols = [symbol for symbol in symbols if addresses[symbol]]
+    
+    if httpx:
+        results = asyncio.run(fetch_all([addresses[symbol] for symbol in known_symbols], timeframe, limit))
+    else:
+        results = [fetch_dexscreener_ohlcv(addresses[symbol], timeframe, limit) for symbol in known_symbols]
+    
+    fetched = dict(zip(known_symbols, results))
+    output = {}
+    for symbol in symbols:
+        if not addresses[symbol]:
+            output[symbol] = {'success': False, 'error': f'Token address not found for {symbol}. Need real contract address.'}
+        elif fetched[symbol]:
+            output[symbol] = fetched[symbol]
+        else:
+            output[symbol] = {'success': False, 'error': f'No DexScreener data available for {symbol}'}
     
-    return known_addresses.get(symbol.upper())
+    return output
 
 def main():
+    # Diagnostics go to stderr; stdout carries only the JSON result
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stderr)
+    
     if len(sys.argv) < 2:
-        print(json.dumps({'success': False, 'error': 'Missing symbol parameter'}))
+        emit_json({'success': False, 'error': 'Missing symbol parameter'})
         return
     
     symbol = sys.argv[1]
     timeframe = sys.argv[2] if len(sys.argv) > 2 else '5m'
     limit = int(sys.argv[3]) if len(sys.argv) > 3 else 60
     
+    # Comma-separated symbols (e.g. BUDDY,RUB) are fetched as one concurrent batch
+    if ',' in symbol:
+        emit_json(fetch_symbols(symbol.split(','), timeframe, limit))
+        return
+    
     # First try to find the token address
     token_address = find_token_address(symbol)
     
     if not token_address:
-        print(json.dumps({'success': False, 'error': f'Token address not found for {symbol}. Need real contract address.'}))
+        emit_json({'success': False, 'error': f'Token address not found for {symbol}. Need real contract address.'})
         return
     
     result = fetch_dexscreener_ohlcv(token_address, timeframe, limit)
     
     if result:
-        print(json.dumps(result))
+        emit_json(result)
     else:
-        print(json.dumps({'success': False, 'error': f'No DexScreener data available for {symbol}'}))
+        emit_json({'success': False, 'error': f'No DexScreener data available for {symbol}'})
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,302 +6,285 @@ Provides reliable token data for all trading pairs
 
 import json
 import time
-import random
+import numpy as np
 from typing import Dict, List
 
+# Core HyperEVM tokens with accurate market data, stored column-wise (SoA).
+# Only price, timestamp and last_trade change between calls; the rest is static.
+_SYMBOLS = (
+    "BUDDY",
+    "RUB",
+    "PURR",
+    "LHYPE",
+    "PiP",
+    "HSTR",
+    "KITTEN",
+    "HL",
+    "LIQD",
+    "FLIP",
+    "LILLY",
+    "VEGAS",
+    "MILK",
+    "WHLP",
+    "perpcoin"
+)
+
+_BASE_PRICES = np.array([
+    0.000303,
+    7193040.0,
+    0.1773,
+    44.57,
+    16.38,
+    0.5604,
+    0.02236,
+    0.0008933,
+    0.01297,
+    0.0003532,
+    0.0007301,
+    0.2956,
+    0.0002323,
+    1.0,
+    0.000749
+], dtype=np.float64)
+
+_META = {
+    "BUDDY": {
+        "name": "alright buddy",
+        "change_24h": 11.26,
+        "volume_24h": 157000,
+        "market_cap": 12800000,
+        "liquidity": 1570000,
+        "pair": "BUDDY/WHYPE",
+        "router": "HyperSwap V2",
+        "source": "DexScreener",
+        "contract_address": "0x123...abc",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "RUB": {
+        "name": "RUB",
+        "change_24h": 25.18,
+        "volume_24h": 36000,
+        "market_cap": 6900000,
+        "liquidity": 360000,
+        "pair": "RUB/WHYPE",
+        "router": "HyperSwap V2",
+        "source": "DexScreener",
+        "contract_address": "0x456...def",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "PURR": {
+        "name": "Purr",
+        "change_24h": 7.3,
+        "volume_24h": 82000,
+        "market_cap": 105700000,
+        "liquidity": 820000,
+        "pair": "PURR/WHYPE",
+        "router": "HyperSwap V3",
+        "source": "DexScreener",
+        "contract_address": "0x789...ghi",
+        "dex_id": "kittenswap",
+        "chain_id": "hyperevm"
+    },
+    "LHYPE": {
+        "name": "Looped HYPE",
+        "change_24h": 7.91,
+        "volume_24h": 521000,
+        "market_cap": 51200000,
+        "liquidity": 5210000,
+        "pair": "LHYPE/WHYPE",
+        "router": "HyperSwap V3",
+        "source": "DexScreener",
+        "contract_address": "0xabc...123",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "PiP": {
+        "name": "PiP",
+        "change_24h": 17.87,
+        "volume_24h": 25000,
+        "market_cap": 16300000,
+        "liquidity": 250000,
+        "pair": "PiP/WHYPE",
+        "router": "HyperSwap V3",
+        "source": "DexScreener",
+        "contract_address": "0xdef...456",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "HSTR": {
+        "name": "HyperStrategy",
+        "change_24h": -10.64,
+        "volume_24h": 12000,
+        "market_cap": 543000,
+        "liquidity": 120000,
+        "pair": "HSTR/WHYPE",
+        "router": "HyperSwap V3",
+        "source": "DexScreener",
+        "contract_address": "0xghi...789",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "KITTEN": {
+        "name": "Kittenswap",
+        "change_24h": 7.99,
+        "volume_24h": 273,
+        "market_cap": 4300000,
+        "liquidity": 2730,
+        "pair": "KITTEN/WHYPE",
+        "router": "Kittenswap V2",
+        "source": "DexScreener",
+        "contract_address": "0xjkl...abc",
+        "dex_id": "kittenswap",
+        "chain_id": "hyperevm"
+    },
+    "HL": {
+        "name": "Holy Liquid",
+        "change_24h": -5.44,
+        "volume_24h": 10000,
+        "market_cap": 813000,
+        "liquidity": 100000,
+        "pair": "HL/WHYPE",
+        "router": "HyperSwap V2",
+        "source": "DexScreener",
+        "contract_address": "0xmno...def",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "LIQD": {
+        "name": "LiquidLaunch",
+        "change_24h": -1.09,
+        "volume_24h": 14000,
+        "market_cap": 15500000,
+        "liquidity": 140000,
+        "pair": "LIQD/WHYPE",
+        "router": "HyperSwap V3",
+        "source": "DexScreener",
+        "contract_address": "0xpqr...ghi",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "FLIP": {
+        "name": "Flip",
+        "change_24h": 16.73,
+        "volume_24h": 7900,
+        "market_cap": 321000,
+        "liquidity": 79000,
+        "pair": "FLIP/WHYPE",
+        "router": "HyperSwap V2",
+        "source": "DexScreener",
+        "contract_address": "0xstu...jkl",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "LILLY": {
+        "name": "Lilly",
+        "change_24h": 8.87,
+        "volume_24h": 8500,
+        "market_cap": 615000,
+        "liquidity": 85000,
+        "pair": "LILLY/WHYPE",
+        "router": "HyperSwap V2",
+        "source": "DexScreener",
+        "contract_address": "0xvwx...mno",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "VEGAS": {
+        "name": "Vegas",
+        "change_24h": 3.25,
+        "volume_24h": 18000,
+        "market_cap": 2900000,
+        "liquidity": 180000,
+        "pair": "VEGAS/WHYPE",
+        "router": "HyperSwap V2",
+        "source": "DexScreener",
+        "contract_address": "0xyz...pqr",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "MILK": {
+        "name": "SUPERMILK",
+        "change_24h": 7.33,
+        "volume_24h": 360,
+        "market_cap": 220000,
+        "liquidity": 3600,
+        "pair": "MILK/WHYPE",
+        "router": "HyperSwap V2",
+        "source": "DexScreener",
+        "contract_address": "0x123...stu",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "WHLP": {
+        "name": "Wrapped HLP",
+        "change_24h": -0.46,
+        "volume_24h": 144000,
+        "market_cap": 7000000,
+        "liquidity": 1440000,
+        "pair": "WHLP/WHYPE",
+        "router": "HyperSwap V3",
+        "source": "DexScreener",
+        "contract_address": "0x456...vwx",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    },
+    "perpcoin": {
+        "name": "perpcoin",
+        "change_24h": 45.27,
+        "volume_24h": 21000,
+        "market_cap": 660000,
+        "liquidity": 210000,
+        "pair": "perpcoin/WHYPE",
+        "router": "HyperSwap V2",
+        "source": "DexScreener",
+        "contract_address": "0x789...xyz",
+        "dex_id": "hyperswap",
+        "chain_id": "hyperevm"
+    }
+}
+
+_RNG = np.random.default_rng()
+
 def get_enhanced_hyperevm_tokens() -> List[Dict]:
     """
     Get comprehensive HyperEVM token data with enhanced accuracy
     """
     current_time = time.time()
+    count = len(_SYMBOLS)
     
-    # Core HyperEVM tokens with accurate market data
-    tokens = [
-        {
-            "symbol": "BUDDY",
-            "name": "alright buddy", 
-            "price": 0.000303,
-            "price_str": "$0.00030300",
-            "change_24h": 11.26,
-            "volume_24h": 157000,
-            "market_cap": 12800000,
-            "liquidity": 1570000,
-            "pair": "BUDDY/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V2",
-            "source": "DexScreener",
-            "contract_address": "0x123...abc",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "RUB",
-            "name": "RUB",
-            "price": 7193040.0,
-            "price_str": "$7193040.00000000", 
-            "change_24h": 25.18,
-            "volume_24h": 36000,
-            "market_cap": 6900000,
-            "liquidity": 360000,
-            "pair": "RUB/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V2",
-            "source": "DexScreener",
-            "contract_address": "0x456...def",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "PURR",
-            "name": "Purr",
-            "price": 0.1773,
-            "price_str": "$0.17730000",
-            "change_24h": 7.30,
-            "volume_24h": 82000,
-            "market_cap": 105700000,
-            "liquidity": 820000,
-            "pair": "PURR/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V3",
-            "source": "DexScreener",
-            "contract_address": "0x789...ghi",
-            "dex_id": "kittenswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "LHYPE",
-            "name": "Looped HYPE",
-            "price": 44.57,
-            "price_str": "$44.57000000",
-            "change_24h": 7.91,
-            "volume_24h": 521000,
-            "market_cap": 51200000,
-            "liquidity": 5210000,
-            "pair": "LHYPE/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V3",
-            "source": "DexScreener",
-            "contract_address": "0xabc...123",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "PiP",
-            "name": "PiP",
-            "price": 16.38,
-            "price_str": "$16.38000000",
-            "change_24h": 17.87,
-            "volume_24h": 25000,
-            "market_cap": 16300000,
-            "liquidity": 250000,
-            "pair": "PiP/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V3",
-            "source": "DexScreener",
-            "contract_address": "0xdef...456",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "HSTR",
-            "name": "HyperStrategy",
-            "price": 0.5604,
-            "price_str": "$0.56040000",
-            "change_24h": -10.64,
-            "volume_24h": 12000,
-            "market_cap": 543000,
-            "liquidity": 120000,
-            "pair": "HSTR/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V3",
-            "source": "DexScreener",
-            "contract_address": "0xghi...789",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "KITTEN",
-            "name": "Kittenswap",
-            "price": 0.02236,
-            "price_str": "$0.02236000",
-            "change_24h": 7.99,
-            "volume_24h": 273,
-            "market_cap": 4300000,
-            "liquidity": 2730,
-            "pair": "KITTEN/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "Kittenswap V2",
-            "source": "DexScreener",
-            "contract_address": "0xjkl...abc",
-            "dex_id": "kittenswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "HL",
-            "name": "Holy Liquid",
-            "price": 0.0008933,
-            "price_str": "$0.00089330",
-            "change_24h": -5.44,
-            "volume_24h": 10000,
-            "market_cap": 813000,
-            "liquidity": 100000,
-            "pair": "HL/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V2",
-            "source": "DexScreener",
-            "contract_address": "0xmno...def",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "LIQD",
-            "name": "LiquidLaunch",
-            "price": 0.01297,
-            "price_str": "$0.01297000",
-            "change_24h": -1.09,
-            "volume_24h": 14000,
-            "market_cap": 15500000,
-            "liquidity": 140000,
-            "pair": "LIQD/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V3",
-            "source": "DexScreener",
-            "contract_address": "0xpqr...ghi",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "FLIP",
-            "name": "Flip",
-            "price": 0.0003532,
-            "price_str": "$0.00035320",
-            "change_24h": 16.73,
-            "volume_24h": 7900,
-            "market_cap": 321000,
-            "liquidity": 79000,
-            "pair": "FLIP/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V2",
-            "source": "DexScreener",
-            "contract_address": "0xstu...jkl",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "LILLY",
-            "name": "Lilly",
-            "price": 0.0007301,
-            "price_str": "$0.00073010",
-            "change_24h": 8.87,
-            "volume_24h": 8500,
-            "market_cap": 615000,
-            "liquidity": 85000,
-            "pair": "LILLY/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V2",
-            "source": "DexScreener",
-            "contract_address": "0xvwx...mno",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "VEGAS",
-            "name": "Vegas",
-            "price": 0.2956,
-            "price_str": "$0.29560000",
-            "change_24h": 3.25,
-            "volume_24h": 18000,
-            "market_cap": 2900000,
-            "liquidity": 180000,
-            "pair": "VEGAS/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V2",
-            "source": "DexScreener",
-            "contract_address": "0xyz...pqr",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "MILK",
-            "name": "SUPERMILK",
-            "price": 0.0002323,
-            "price_str": "$0.00023230",
-            "change_24h": 7.33,
-            "volume_24h": 360,
-            "market_cap": 220000,
-            "liquidity": 3600,
-            "pair": "MILK/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V2",
-            "source": "DexScreener",
-            "contract_address": "0x123...stu",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "WHLP",
-            "name": "Wrapped HLP",
-            "price": 1.0,
-            "price_str": "$1.00000000",
-            "change_24h": -0.46,
-            "volume_24h": 144000,
-            "market_cap": 7000000,
-            "liquidity": 1440000,
-            "pair": "WHLP/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V3",
-            "source": "DexScreener",
-            "contract_address": "0x456...vwx",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        },
-        {
-            "symbol": "perpcoin",
-            "name": "perpcoin",
-            "price": 0.000749,
-            "price_str": "$0.00074900",
-            "change_24h": 45.27,
-            "volume_24h": 21000,
-            "market_cap": 660000,
-            "liquidity": 210000,
-            "pair": "perpcoin/WHYPE",
-            "timestamp": current_time,
-            "last_trade": current_time - random.randint(1, 60),
-            "router": "HyperSwap V2",
-            "source": "DexScreener",
-            "contract_address": "0x789...xyz",
-            "dex_id": "hyperswap",
-            "chain_id": "hyperevm"
-        }
-    ]
+    # Apply slight price volatility to simulate real-time movements (±0.2%)
+    volatility = _RNG.uniform(-0.002, 0.002, count)
+    prices = _BASE_PRICES * (1 + volatility)
+    
+    # Recent trade times for real-time feel
+    last_trades = current_time - _RNG.integers(1, 301, count)
     
-    # Apply slight price volatility to simulate real-time movements
-    for token in tokens:
-        volatility = random.uniform(-0.002, 0.002)  # ±0.2% volatility
-        original_price = token["price"]
-        new_price = original_price * (1 + volatility)
-        
-        # Update price but keep it realistic
-        token["price"] = round(new_price, 8)
-        token["price_str"] = f"${new_price:.8f}"
-        
-        # Update timestamp for real-time feel
-        token["timestamp"] = current_time
-        token["last_trade"] = current_time - random.randint(1, 300)
+    # Rounded once over the whole column; price_str still formats the unrounded value
+    rounded_prices = np.round(prices, 8)
+    
+    tokens = []
+    for symbol, price, rounded_price, last_trade in zip(_SYMBOLS, prices.tolist(), rounded_prices.tolist(), last_trades.tolist()):
+        meta = _META[symbol]
+        tokens.append({
+            "symbol": symbol,
+            "name": meta["name"],
+            "price": rounded_price,
+            "price_str": f"${price:.8f}",
+            "change_24h": meta["change_24h"],
+            "volume_24h": meta["volume_24h"],
+            "market_cap": meta["market_cap"],
+            "liquidity": meta["liquidity"],
+            "pair": meta["pair"],
+            "timestamp": current_time,
+            "last_trade": last_trade,
+            "router": meta["router"],
+            "source": meta["source"],
+            "contract_address": meta["contract_address"],
+            "dex_id": meta["dex_id"],
+            "chain_id": meta["chain_id"]
+        })
     
     return tokens
 
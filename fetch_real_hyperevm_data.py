@@ -1,8 +1,162 @@
 #!/usr/bin/env python3
 import requests
 import json
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import _cache
+from _jsonio import json_loads
+from _tokens import to_float
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec:
+    # Typed view of the DexScreener pairs payload; msgspec skips every undeclared field
+    # and (with strict=False) coerces the string prices to float while decoding
+    class _DexToken(msgspec.Struct):
+        symbol: Optional[str] = None
+        name: Optional[str] = None
+        address: Optional[str] = None
+
+    class _DexWindow(msgspec.Struct):
+        h24: Optional[float] = None
+
+    class _DexLiquidity(msgspec.Struct):
+        usd: Optional[float] = None
+
+    class _DexPair(msgspec.Struct):
+        chainId: Optional[str] = None
+        baseToken: Optional[_DexToken] = None
+        priceUsd: Optional[float] = None
+        priceNative: Optional[float] = None
+        volume: Optional[_DexWindow] = None
+        priceChange: Optional[_DexWindow] = None
+        liquidity: Optional[_DexLiquidity] = None
+        dexId: Optional[str] = None
+        pairAddress: Optional[str] = None
+
+    class _DexPairsResponse(msgspec.Struct):
+        pairs: Optional[List[_DexPair]] = None
+
+    _PAIRS_DECODER = msgspec.json.Decoder(_DexPairsResponse, strict=False)
+
+def _json_dump_bytes(obj):
+    """Serialize to indented JSON bytes, preferring orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _iter_pairs(response):
+    """
+    Yield the DexScreener 'pairs' items from a streamed response
+    With ijson each pair is parsed straight off the socket instead of materializing the whole payload
+    """
+    if ijson:
+        response.raw.decode_content = True  # let urllib3 undo gzip/deflate before parsing
+        yield from ijson.items(response.raw, 'pairs.item', use_float=True)
+    else:
+        yield from json_loads(response.content).get('pairs') or []
+
+def _token_entry(symbol, name, address, price_usd, price_native, volume_24h, price_change_24h, liquidity_usd, dex_id, pair_address):
+    """Build the saved token record for one HyperEVM pair"""
+    return {
+        'symbol': symbol,
+        'name': name,
+        'address': address,
+        'price_usd': price_usd,
+        'price_native': price_native,
+        'volume_24h': volume_24h,
+        'price_change_24h': price_change_24h,
+        'liquidity_usd': liquidity_usd,
+        'dex_id': dex_id,
+        'pair_address': pair_address,
+        'chain_id': 'hyperevm'
+    }
+
+def _tokens_from_pair_dicts(pairs):
+    """
+    Collect HyperEVM base tokens from parsed pair dicts
+    Filters while iterating so discarded pairs never pile up in memory; returns (pair_count, tokens)
+    """
+    tokens = {}
+    pair_count = 0
+    for pair in pairs:
+        pair_count += 1
+        if pair.get('chainId') != 'hyperevm':
+            continue
+        
+        base_token = pair.get('baseToken') or {}
+        symbol = base_token.get('symbol')
+        if symbol in (None, '', 'HYPE'):
+            continue
+        
+        tokens[symbol] = _token_entry(
+            symbol,
+            base_token.get('name', f"{symbol} Token"),
+            base_token.get('address'),
+            to_float(pair, 'priceUsd'),
+            to_float(pair, 'priceNative'),
+            to_float(pair.get('volume'), 'h24'),
+            to_float(pair.get('priceChange'), 'h24'),
+            to_float(pair.get('liquidity'), 'usd'),
+            pair.get('dexId'),
+            pair.get('pairAddress')
+        )
+    
+    return pair_count, tokens
+
+def _tokens_from_typed_pairs(pairs):
+    """
+    Collect HyperEVM base tokens from msgspec-decoded pairs using plain attribute access
+    """
+    tokens = {}
+    for pair in pairs:
+        base_token = pair.baseToken
+        if pair.chainId != 'hyperevm' or base_token is None or base_token.symbol in (None, '', 'HYPE'):
+            continue
+        
+        symbol = base_token.symbol
+        tokens[symbol] = _token_entry(
+            symbol,
+            base_token.name if base_token.name is not None else f"{symbol} Token",
+            base_token.address,
+            pair.priceUsd or 0.0,
+            pair.priceNative or 0.0,
+            (pair.volume and pair.volume.h24) or 0.0,
+            (pair.priceChange and pair.priceChange.h24) or 0.0,
+            (pair.liquidity and pair.liquidity.usd) or 0.0,
+            pair.dexId,
+            pair.pairAddress
+        )
+    
+    return tokens
+
+# Shared keep-alive session so DexScreener/Gecko Terminal calls reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
 
 def fetch_dexscreener_hyperevm_data():
     """
@@ -12,52 +166,42 @@ def fetch_dexscreener_hyperevm_data():
         # DexScreener API for HyperEVM tokens
         url = "https://api.dexscreener.com/latest/dex/tokens/hyperevm"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        print("🔍 Fetching real HyperEVM token data from DexScreener...")
+        print("🔍 Fetching real HyperEVM token data from DexScreener...", file=sys.stderr)
         
-        response = requests.get(url, headers=headers, timeout=10)
+        # Revalidate with the last run's ETag; an unchanged listing comes back as a bodiless 304
+        etag, cached = _cache.get_etag(url)
+        headers = {'If-None-Match': etag} if etag else {}
+        response = _SESSION.get(url, headers=headers, timeout=10, stream=not msgspec)
         response.raise_for_status()
         
-        data = response.json()
-        
-        if 'pairs' in data and data['pairs']:
-            print(f"✅ Found {len(data['pairs'])} trading pairs on HyperEVM")
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            pair_count, tokens = cached['pair_count'], cached['tokens']
             
-            tokens = {}
-            for pair in data['pairs']:
-                if pair.get('chainId') == 'hyperevm':
-                    base_token = pair.get('baseToken', {})
-                    quote_token = pair.get('quoteToken', {})
-                    
-                    # Get base token data
-                    if base_token.get('symbol') and base_token.get('symbol') != 'HYPE':
-                        symbol = base_token.get('symbol')
-                        tokens[symbol] = {
-                            'symbol': symbol,
-                            'name': base_token.get('name', f"{symbol} Token"),
-                            'address': base_token.get('address'),
-                            'price_usd': float(pair.get('priceUsd', '0')),
-                            'price_native': float(pair.get('priceNative', '0')),
-                            'volume_24h': float(pair.get('volume', {}).get('h24', 0)),
-                            'price_change_24h': float(pair.get('priceChange', {}).get('h24', 0)),
-                            'liquidity_usd': float(pair.get('liquidity', {}).get('usd', 0)),
-                            'dex_id': pair.get('dexId'),
-                            'pair_address': pair.get('pairAddress'),
-                            'chain_id': pair.get('chainId')
-                        }
+        elif msgspec:
+            pairs = _PAIRS_DECODER.decode(response.content).pairs or []
+            pair_count = len(pairs)
+            tokens = _tokens_from_typed_pairs(pairs)
             
-            print(f"📊 Processed {len(tokens)} unique tokens")
+        else:
+            with response:
+                pair_count, tokens = _tokens_from_pair_dicts(_iter_pairs(response))
+        
+        new_etag = response.headers.get('ETag')
+        if new_etag and response.status_code == 200:
+            _cache.put_etag(url, new_etag, {'pair_count': pair_count, 'tokens': tokens})
+        
+        if pair_count:
+            print(f"✅ Found {pair_count} trading pairs on HyperEVM", file=sys.stderr)
+            print(f"📊 Processed {len(tokens)} unique tokens", file=sys.stderr)
             return tokens
             
         else:
-            print("❌ No trading pairs found")
+            print("❌ No trading pairs found", file=sys.stderr)
             return {}
             
     except Exception as e:
-        print(f"❌ Error fetching DexScreener data: {e}")
+        print(f"❌ Error fetching DexScreener data: {e}", file=sys.stderr)
         return {}
 
 def fetch_gecko_terminal_hyperevm():
@@ -67,16 +211,12 @@ def fetch_gecko_terminal_hyperevm():
     try:
         url = "https://api.geckoterminal.com/api/v2/networks/hyperevm/pools"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        print("🦎 Fetching from Gecko Terminal...", file=sys.stderr)
         
-        print("🦎 Fetching from Gecko Terminal...")
-        
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
+        data = json_loads(response.content)
         
         tokens = {}
         if 'data' in data:
@@ -97,21 +237,22 @@ def fetch_gecko_terminal_hyperevm():
                             'chain_id': 'hyperevm'
                         }
         
-        print(f"🦎 Gecko Terminal found {len(tokens)} tokens")
+        print(f"🦎 Gecko Terminal found {len(tokens)} tokens", file=sys.stderr)
         return tokens
         
     except Exception as e:
-        print(f"❌ Gecko Terminal error: {e}")
+        print(f"❌ Gecko Terminal error: {e}", file=sys.stderr)
         return {}
 
 def main():
     print("🚀 Fetching real HyperEVM token data...")
     
-    # Try DexScreener first
-    dex_tokens = fetch_dexscreener_hyperevm_data()
-    
-    # Try Gecko Terminal as backup
-    gecko_tokens = fetch_gecko_terminal_hyperevm()
+    # Query DexScreener and Gecko Terminal (backup) concurrently over the shared session
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        dex_future = pool.submit(fetch_dexscreener_hyperevm_data)
+        gecko_future = pool.submit(fetch_gecko_terminal_hyperevm)
+        dex_tokens = dex_future.result()
+        gecko_tokens = gecko_future.result()
     
     # Combine data (DexScreener takes priority)
     all_tokens = {**gecko_tokens, **dex_tokens}
@@ -139,8 +280,8 @@ def main():
             'count': len(all_tokens)
         }
         
-        with open('real_hyperevm_tokens.json', 'w') as f:
-            json.dump(output_data, f, indent=2)
+        with open('real_hyperevm_tokens.json', 'wb') as f:
+            f.write(_json_dump_bytes(output_data))
         
         print(f"\n💾 Saved {len(all_tokens)} tokens to real_hyperevm_tokens.json")
         return all_tokens
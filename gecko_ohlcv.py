@@ -5,10 +5,17 @@ Fetches authentic OHLCV candlestick data from GeckoTerminal API
 """
 
 import json
+import math
 import sys
 import time
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+
+import urllib3
+
+from _http import get_json
+from _jsonio import emit_json
+
+# Recent candles barely move within a minute, so repeat chart loads skip the API
+OHLCV_CACHE_TTL = 60
 
 def fetch_ohlcv_data(network_id, pool_address, timeframe='5m', limit=100):
     """
@@ -30,93 +37,90 @@ def fetch_ohlcv_data(network_id, pool_address, timeframe='5m', limit=100):
         params = f"?limit={limit}&aggregate=1d" if timeframe == '1d' else f"?limit={limit}"
         full_url = url + params
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        }
+        status, data = get_json(full_url, OHLCV_CACHE_TTL)
         
-        request = Request(full_url, headers=headers)
-        
-        with urlopen(request, timeout=15) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode('utf-8'))
+        if status == 200:
+            
+            if 'data' in data and 'attributes' in data['data']:
+                ohlcv_list = data['data']['attributes'].get('ohlcv_list', [])
                 
-                if 'data' in data and 'attributes' in data['data']:
-                    ohlcv_list = data['data']['attributes'].get('ohlcv_list', [])
+                if ohlcv_list:
+                    print(f"✅ Fetched {len(ohlcv_list)} real {timeframe} candles from GeckoTerminal", file=sys.stderr)
+                    return parse_ohlcv_candles(ohlcv_list, timeframe)
+                else:
+                    print(f"❌ No OHLCV data available for {pool_address}", file=sys.stderr)
                     
-                    if ohlcv_list:
-                        print(f"✅ Fetched {len(ohlcv_list)} real {timeframe} candles from GeckoTerminal", file=sys.stderr)
-                        return parse_ohlcv_candles(ohlcv_list, timeframe)
-                    else:
-                        print(f"❌ No OHLCV data available for {pool_address}", file=sys.stderr)
-                        
-            else:
-                print(f"❌ GeckoTerminal API error: HTTP {response.status}", file=sys.stderr)
+        else:
+            print(f"❌ GeckoTerminal API error: HTTP {status}", file=sys.stderr)
                 
-    except (URLError, HTTPError, json.JSONDecodeError) as e:
+    except (urllib3.exceptions.HTTPError, json.JSONDecodeError) as e:
         print(f"GeckoTerminal OHLCV API error: {e}", file=sys.stderr)
         
     return []
 
-def parse_ohlcv_candles(ohlcv_list, timeframe):
+def _ohlcv_rows(ohlcv_list):
     """
-    Parse GeckoTerminal OHLCV data into our candlestick format
-    
-    OHLCV format: [timestamp_unix_ms, open, high, low, close, volume]
+    Parse [timestamp, open, high, low, close, volume] rows into lists of floats
+    Rows that are too short or hold null, non-numeric or non-finite values are dropped
     """
-    candles = []
-    
+    parsed = []
     for ohlcv in ohlcv_list:
+        if len(ohlcv) < 6:
+            continue
         try:
-            if len(ohlcv) >= 6:
-                timestamp = int(ohlcv[0])  # Unix milliseconds
-                open_price = float(ohlcv[1])
-                high_price = float(ohlcv[2])
-                low_price = float(ohlcv[3])
-                close_price = float(ohlcv[4])
-                volume = float(ohlcv[5])
-                
-                # Skip invalid candles
-                if open_price > 0 and high_price > 0 and low_price > 0 and close_price > 0:
-                    candle = {
-                        "timestamp": timestamp,
-                        "open": open_price,
-                        "high": high_price,
-                        "low": low_price,
-                        "close": close_price,
-                        "volume": volume,
-                        "direction": "up" if close_price >= open_price else "down",
-                        "timeframe": timeframe,
-                        "source": "GeckoTerminal_Real"
-                    }
-                    candles.append(candle)
-                    
-        except (ValueError, IndexError) as e:
+            row = [float(value) for value in ohlcv[:6]]
+        except (ValueError, TypeError) as e:
             print(f"Error parsing OHLCV candle: {e}", file=sys.stderr)
             continue
+        if all(map(math.isfinite, row)):
+            parsed.append(row)
+    return parsed
+
+def parse_ohlcv_candles(ohlcv_list, timeframe):
+    """
+    Parse GeckoTerminal OHLCV data into our candlestick format
     
-    # Sort by timestamp (newest first for chart display)
-    candles.sort(key=lambda x: x['timestamp'], reverse=True)
+    OHLCV format: [timestamp_unix_ms, open, high, low, close, volume]
+    """
+    # Skip invalid candles, then sort by timestamp (newest first for chart display)
+    rows = [row for row in _ohlcv_rows(ohlcv_list) if min(row[1:5]) > 0]
     
+    # GeckoTerminal already sends newest first, so an O(N) order check usually saves the sort
+    if any(newer[0] < older[0] for newer, older in zip(rows, rows[1:])):
+        rows.sort(key=lambda row: row[0], reverse=True)
+
+    candles = [
+        {
+            "timestamp": int(timestamp),  # Unix milliseconds
+            "open": open_price,
+            "high": high_price,
+            "low": low_price,
+            "close": close_price,
+            "volume": volume,
+            "direction": "up" if close_price >= open_price else "down",
+            "timeframe": timeframe,
+            "source": "GeckoTerminal_Real"
+        }
+        for timestamp, open_price, high_price, low_price, close_price, volume in rows
+    ]
+
     print(f"📊 Processed {len(candles)} valid {timeframe} candles", file=sys.stderr)
     return candles
 
+# Known pool addresses for major HyperEVM tokens
+_KNOWN_POOLS = {
+    'BUDDY': '0x123...abc',  # Would need real pool address
+    'RUB': '0x456...def',    # Would need real pool address  
+    'LHYPE': '0x789...ghi',  # Would need real pool address
+    # Add more as discovered
+}
+
 def find_hyperevm_pool_address(token_symbol):
     """
     Try to find the pool address for a token on HyperEVM
     This is a simplified approach - in production you'd maintain a mapping
     """
-    # Known pool addresses for major HyperEVM tokens
-    known_pools = {
-        'BUDDY': '0x123...abc',  # Would need real pool address
-        'RUB': '0x456...def',    # Would need real pool address  
-        'LHYPE': '0x789...ghi',  # Would need real pool address
-        # Add more as discovered
-    }
-    
-    return known_pools.get(token_symbol.upper())
+    return _KNOWN_POOLS.get(token_symbol.upper())
 
 def get_real_chart_data(token_symbol, timeframe='5m', candle_count=60):
     """
@@ -156,9 +160,9 @@ if __name__ == "__main__":
         chart_data = get_real_chart_data(symbol, timeframe)
         
         if chart_data:
-            print(json.dumps(chart_data, indent=2))
+            emit_json(chart_data, indent=True)
         else:
-            print(json.dumps({"error": f"No chart data available for {symbol}"}))
+            emit_json({"error": f"No chart data available for {symbol}"})
     else:
         print("Usage: python gecko_ohlcv.py <TOKEN_SYMBOL> [TIMEFRAME]")
         print("Example: python gecko_ohlcv.py BUDDY 5m")
\ No newline at end of file
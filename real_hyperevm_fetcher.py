@@ -4,11 +4,40 @@ Real HyperEVM token fetcher using DexScreener and Gecko Terminal APIs
 Fetches authentic token data from HyperEVM network
 """
 
-import json
+import asyncio
+import importlib.util
 import sys
 import time
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+
+import _cache
+from _http import DEFAULT_HEADERS, get_json
+from _jsonio import emit_json, json_loads
+from _tokens import HYPE_SYMBOLS, to_float, to_int
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# HTTP/2 multiplexing needs the optional h2 package alongside httpx
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+DEXSCREENER_PAIRS_URL = "https://api.dexscreener.com/latest/dex/pairs/hyperevm"
+GECKO_NETWORKS_URL = "https://api.geckoterminal.com/api/v2/networks"
+# GeckoTerminal identifiers to probe for HyperEVM pools, most likely first
+GECKO_PROBE_IDS = ('hyperevm', 'hyperliquid', 'hyper')
+
+# Identifier whose pools endpoint answered last; later calls in this process try it first
+_gecko_network_id = None
+
+# Seconds a cached response stays fresh: prices move fast, pool lists slowly
+DEXSCREENER_CACHE_TTL = 30
+GECKO_POOLS_CACHE_TTL = 300
 
 def fetch_dexscreener_hyperevm():
     """
@@ -16,111 +45,195 @@ def fetch_dexscreener_hyperevm():
     """
     try:
         # DexScreener API for HyperEVM network
-        url = "https://api.dexscreener.com/latest/dex/pairs/hyperevm"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        }
-        
-        request = Request(url, headers=headers)
+        status, data = get_json(DEXSCREENER_PAIRS_URL, DEXSCREENER_CACHE_TTL)
         
-        with urlopen(request, timeout=15) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode('utf-8'))
-                
-                if 'pairs' in data and data['pairs']:
-                    print(f"✅ DexScreener: Found {len(data['pairs'])} real HyperEVM pairs", file=sys.stderr)
-                    return parse_dexscreener_pairs(data['pairs'])
+        if status == 200:
+            
+            if 'pairs' in data and data['pairs']:
+                print(f"✅ DexScreener: Found {len(data['pairs'])} real HyperEVM pairs", file=sys.stderr)
+                return parse_dexscreener_pairs(data['pairs'])
                     
     except Exception as e:
         print(f"DexScreener API error: {e}", file=sys.stderr)
         
     return []
 
+def _probe_order():
+    """GeckoTerminal identifiers to try, the one that answered last time first"""
+    if _gecko_network_id is None:
+        return GECKO_PROBE_IDS
+    return (_gecko_network_id,) + tuple(pid for pid in GECKO_PROBE_IDS if pid != _gecko_network_id)
+
+def _gecko_pools_url(network_id):
+    """GeckoTerminal pools listing for one network identifier"""
+    return f"{GECKO_NETWORKS_URL}/{network_id}/pools"
+
+def _pick_pools(probe_ids, probe_results):
+    """
+    Parse the first probe (in priority order) that returned pools, remembering its identifier
+    """
+    global _gecko_network_id
+    
+    for possible_id, pools_data in zip(probe_ids, probe_results):
+        if pools_data and pools_data.get('data'):
+            _gecko_network_id = possible_id
+            print(f"✅ GeckoTerminal: Found {len(pools_data['data'])} pools on {possible_id}", file=sys.stderr)
+            return parse_geckoterminal_pools(pools_data['data'])
+    return []
+
+async def _h2_get_all(urls, ttl, timeout=10):
+    """
+    GET several URLs on one host at once through httpx and return the parsed JSON (or None) per URL
+    With h2 installed the requests are multiplexed as streams over a single HTTP/2 connection
+    """
+    async def get_one(client, url):
+        data = _cache.get(url, ttl)
+        if data is not None:
+            return data
+        
+        try:
+            response = await client.get(url)
+            if response.status_code == 200:
+                data = json_loads(response.content)
+                _cache.put(url, data)
+                return data
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Request error for {url}: {e}", file=sys.stderr)
+        return None
+    
+    async with httpx.AsyncClient(http2=_HTTP2_AVAILABLE, timeout=timeout, headers=DEFAULT_HEADERS) as client:
+        return await asyncio.gather(*[get_one(client, url) for url in urls])
+
 def fetch_geckoterminal_hyperevm():
     """
     Fetch real HyperEVM tokens from Gecko Terminal API
+    Probes the pools endpoint of each candidate network ID directly; the first that answers wins
     """
+    first_id, *fallback_ids = _probe_order()
+    
     try:
-        # First get the networks to find HyperEVM ID
-        networks_url = "https://api.geckoterminal.com/api/v2/networks"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        }
-        
-        request = Request(networks_url, headers=headers)
-        
-        with urlopen(request, timeout=15) as response:
-            if response.status == 200:
-                networks_data = json.loads(response.read().decode('utf-8'))
-                
-                # Look for HyperEVM network ID
-                hyperevm_id = None
-                for network in networks_data.get('data', []):
-                    attrs = network.get('attributes', {})
-                    if 'hyper' in attrs.get('name', '').lower() or attrs.get('identifier') == 'hyperevm':
-                        hyperevm_id = attrs.get('identifier')
-                        break
-                
-                if not hyperevm_id:
-                    # Try common variations
-                    for possible_id in ['hyperevm', 'hyperliquid', 'hyper']:
-                        try:
-                            pools_url = f"https://api.geckoterminal.com/api/v2/networks/{possible_id}/pools"
-                            pools_request = Request(pools_url, headers=headers)
-                            
-                            with urlopen(pools_request, timeout=10) as pools_response:
-                                if pools_response.status == 200:
-                                    pools_data = json.loads(pools_response.read().decode('utf-8'))
-                                    if pools_data.get('data'):
-                                        print(f"✅ GeckoTerminal: Found {len(pools_data['data'])} pools on {possible_id}", file=sys.stderr)
-                                        return parse_geckoterminal_pools(pools_data['data'])
-                        except:
-                            continue
-                            
+        pools_status, pools_data = get_json(_gecko_pools_url(first_id), GECKO_POOLS_CACHE_TTL, timeout=10)
+        if pools_status == 200 and pools_data.get('data'):
+            return _pick_pools([first_id], [pools_data])
     except Exception as e:
-        print(f"GeckoTerminal API error: {e}", file=sys.stderr)
+        print(f"GeckoTerminal API error for {first_id}: {e}", file=sys.stderr)
+    
+    if httpx is not None:
+        # Remaining probes go out together instead of one round trip each
+        probe_results = asyncio.run(_h2_get_all([_gecko_pools_url(pid) for pid in fallback_ids], GECKO_POOLS_CACHE_TTL))
+        return _pick_pools(fallback_ids, probe_results)
+    
+    for possible_id in fallback_ids:
+        try:
+            pools_status, pools_data = get_json(_gecko_pools_url(possible_id), GECKO_POOLS_CACHE_TTL, timeout=10)
+            
+            if pools_status == 200 and pools_data.get('data'):
+                return _pick_pools([possible_id], [pools_data])
+        except Exception as e:
+            print(f"GeckoTerminal API error for {possible_id}: {e}", file=sys.stderr)
+            continue
         
     return []
 
+async def _aget(session, url, ttl, timeout=15):
+    """
+    GET a URL on a shared aiohttp session and return the parsed JSON, or None on failure
+    Served from the on-disk cache when a copy younger than ttl seconds exists
+    """
+    data = _cache.get(url, ttl)
+    if data is not None:
+        return data
+    
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status == 200:
+                data = json_loads(await response.read())
+                _cache.put(url, data)
+                return data
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        print(f"Request error for {url}: {e}", file=sys.stderr)
+    return None
+
+async def _fetch_dex(session):
+    """
+    Async variant of fetch_dexscreener_hyperevm
+    """
+    data = await _aget(session, DEXSCREENER_PAIRS_URL, DEXSCREENER_CACHE_TTL)
+    
+    if data and data.get('pairs'):
+        print(f"✅ DexScreener: Found {len(data['pairs'])} real HyperEVM pairs", file=sys.stderr)
+        return parse_dexscreener_pairs(data['pairs'])
+    return []
+
+async def _fetch_gt(session):
+    """
+    Async variant of fetch_geckoterminal_hyperevm
+    The likeliest identifier is tried alone; only if it misses are the others probed, all at once
+    """
+    first_id, *fallback_ids = _probe_order()
+    first_data = await _aget(session, _gecko_pools_url(first_id), GECKO_POOLS_CACHE_TTL, timeout=10)
+    
+    if first_data and first_data.get('data'):
+        return _pick_pools([first_id], [first_data])
+    
+    fallback_urls = [_gecko_pools_url(pid) for pid in fallback_ids]
+    if httpx is not None:
+        # aiohttp speaks HTTP/1.1 only; httpx can share one multiplexed connection for the fan-out
+        probe_results = await _h2_get_all(fallback_urls, GECKO_POOLS_CACHE_TTL)
+    else:
+        probe_results = await asyncio.gather(
+            *[_aget(session, url, GECKO_POOLS_CACHE_TTL, timeout=10) for url in fallback_urls]
+        )
+    return _pick_pools(fallback_ids, probe_results)
+
+async def _fetch_all_sources():
+    """
+    Query DexScreener and GeckoTerminal concurrently on one aiohttp session
+    """
+    connector = aiohttp.TCPConnector(limit_per_host=64)
+    async with aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS) as session:
+        return await asyncio.gather(_fetch_dex(session), _fetch_gt(session))
+
 def parse_dexscreener_pairs(pairs):
     """
     Parse DexScreener pairs data into token format
     """
     tokens = []
     seen_symbols = set()
+    now = int(time.time())
     
     for pair in pairs:
         try:
-            base_token = pair.get('baseToken', {})
-            quote_token = pair.get('quoteToken', {})
+            # Bind the nested sections once; every field below is a single lookup off a local
+            get = pair.get
+            base_token = get('baseToken') or {}
+            quote_token = get('quoteToken') or {}
             
             # Focus on pairs with HYPE as quote token
-            if quote_token.get('symbol') in ['HYPE', 'WHYPE']:
+            if quote_token.get('symbol') in HYPE_SYMBOLS:
                 symbol = base_token.get('symbol', '')
                 
-                if symbol and symbol not in seen_symbols and symbol not in ['HYPE', 'WHYPE']:
-                    price_usd = float(pair.get('priceUsd', 0))
+                if symbol and symbol not in seen_symbols and symbol not in HYPE_SYMBOLS:
+                    price_usd = to_float(pair, 'priceUsd')
                     
                     if price_usd > 0:
-                        change_24h = float(pair.get('priceChange', {}).get('h24', 0))
-                        volume_24h = int(float(pair.get('volume', {}).get('h24', 0)))
-                        liquidity_usd = int(float(pair.get('liquidity', {}).get('usd', 0)))
-                        market_cap = int(float(pair.get('marketCap', 0)))
+                        change_24h = to_float(get('priceChange'), 'h24')
+                        volume_24h = to_int(get('volume'), 'h24')
+                        liquidity_usd = to_int(get('liquidity'), 'usd')
+                        market_cap = to_int(pair, 'marketCap')
                         
                         tokens.append({
                             'symbol': symbol,
                             'name': base_token.get('name', symbol),
-                            'price': f"{price_usd:.8f}",
-                            'change_24h': f"{change_24h:+.2f}",
+                            'price': format(price_usd, '.8f'),
+                            'change_24h': format(change_24h, '+.2f'),
                             'volume_24h': volume_24h,
                             'market_cap': market_cap,
                             'liquidity': liquidity_usd,
-                            'last_updated': int(time.time()),
+                            'last_updated': now,
                             'source': 'dexscreener',
-                            'pair_address': pair.get('pairAddress', ''),
-                            'dex_id': pair.get('dexId', ''),
+                            'pair_address': get('pairAddress', ''),
+                            'dex_id': get('dexId', ''),
                             'chain_id': 'hyperevm'
                         })
                         
@@ -138,35 +251,38 @@ def parse_geckoterminal_pools(pools):
     """
     tokens = []
     seen_symbols = set()
+    now = int(time.time())
     
     for pool in pools:
         try:
-            attrs = pool.get('attributes', {})
-            base_token = attrs.get('base_token', {})
-            quote_token = attrs.get('quote_token', {})
+            # Bind the nested sections once; every field below is a single lookup off a local
+            attrs = pool.get('attributes') or {}
+            get = attrs.get
+            base_token = get('base_token') or {}
+            quote_token = get('quote_token') or {}
             
             # Focus on pairs with HYPE as quote token
-            if quote_token.get('symbol') in ['HYPE', 'WHYPE']:
+            if quote_token.get('symbol') in HYPE_SYMBOLS:
                 symbol = base_token.get('symbol', '')
                 
-                if symbol and symbol not in seen_symbols and symbol not in ['HYPE', 'WHYPE']:
-                    price_usd = float(attrs.get('base_token_price_usd', 0))
+                if symbol and symbol not in seen_symbols and symbol not in HYPE_SYMBOLS:
+                    price_usd = to_float(attrs, 'base_token_price_usd')
                     
                     if price_usd > 0:
-                        change_24h = float(attrs.get('price_change_percentage', {}).get('h24', 0))
-                        volume_24h = int(float(attrs.get('volume_usd', {}).get('h24', 0)))
-                        liquidity_usd = int(float(attrs.get('reserve_in_usd', 0)))
-                        market_cap = int(float(attrs.get('market_cap_usd', 0)))
+                        change_24h = to_float(get('price_change_percentage'), 'h24')
+                        volume_24h = to_int(get('volume_usd'), 'h24')
+                        liquidity_usd = to_int(attrs, 'reserve_in_usd')
+                        market_cap = to_int(attrs, 'market_cap_usd')
                         
                         tokens.append({
                             'symbol': symbol,
                             'name': base_token.get('name', symbol),
-                            'price': f"{price_usd:.8f}",
-                            'change_24h': f"{change_24h:+.2f}",
+                            'price': format(price_usd, '.8f'),
+                            'change_24h': format(change_24h, '+.2f'),
                             'volume_24h': volume_24h,
                             'market_cap': market_cap,
                             'liquidity': liquidity_usd,
-                            'last_updated': int(time.time()),
+                            'last_updated': now,
                             'source': 'geckoterminal',
                             'pool_address': pool.get('id', ''),
                             'chain_id': 'hyperevm'
@@ -187,32 +303,38 @@ def main():
     try:
         all_tokens = []
         
-        # Try DexScreener first
-        dexscreener_tokens = fetch_dexscreener_hyperevm()
-        all_tokens.extend(dexscreener_tokens)
-        
-        # Try GeckoTerminal if DexScreener didn't return enough tokens
-        if len(all_tokens) < 5:
-            geckoterminal_tokens = fetch_geckoterminal_hyperevm()
-            all_tokens.extend(geckoterminal_tokens)
+        if aiohttp is not None:
+            # Both sources in flight at once: latency is the slower of the two, not their sum
+            dexscreener_tokens, geckoterminal_tokens = asyncio.run(_fetch_all_sources())
+            all_tokens.extend(dexscreener_tokens)
+            
+            # Use GeckoTerminal if DexScreener didn't return enough tokens
+            if len(all_tokens) < 5:
+                all_tokens.extend(geckoterminal_tokens)
+        else:
+            # Try DexScreener first
+            dexscreener_tokens = fetch_dexscreener_hyperevm()
+            all_tokens.extend(dexscreener_tokens)
+            
+            # Try GeckoTerminal if DexScreener didn't return enough tokens
+            if len(all_tokens) < 5:
+                geckoterminal_tokens = fetch_geckoterminal_hyperevm()
+                all_tokens.extend(geckoterminal_tokens)
         
         # If APIs fail, use the real tokens from DexScreener webpage data
         if len(all_tokens) == 0:
             print("Using authentic HyperEVM tokens from DexScreener", file=sys.stderr)
             all_tokens = get_authentic_hyperevm_tokens()
         
-        # Remove duplicates based on symbol
-        unique_tokens = []
-        seen_symbols = set()
-        
+        # Remove duplicates based on symbol: one dict keyed by symbol, first occurrence wins and keeps its position
+        by_symbol = {}
         for token in all_tokens:
-            if token['symbol'] not in seen_symbols:
-                unique_tokens.append(token)
-                seen_symbols.add(token['symbol'])
+            by_symbol.setdefault(token['symbol'], token)
+        unique_tokens = list(by_symbol.values())
         
         if unique_tokens:
             print(f"✅ Found {len(unique_tokens)} real HyperEVM tokens", file=sys.stderr)
-            print(json.dumps(unique_tokens, indent=2))
+            emit_json(unique_tokens, indent=True)
         else:
             raise Exception("No real HyperEVM tokens found")
             
@@ -223,129 +345,131 @@ def main():
         # The server should handle this by showing an error message
         print("[]")
 
+# Only verified HyperEVM tokens from actual DexScreener data
+# Static apart from last_updated, which get_authentic_hyperevm_tokens stamps per call
+_AUTHENTIC_TOKENS = [
+    {
+        'symbol': 'BUDDY',
+        'name': 'alright buddy',
+        'price': '0.01214000',
+        'change_24h': '+2.01',
+        'volume_24h': 132000,
+        'market_cap': 12000000,
+        'liquidity': 895000,
+        'last_updated': 0,
+        'source': 'dexscreener_authentic',
+        'pair_address': '0x056f0975f104cb5318ecc55f0c82b33a756d29c6',
+        'dex_id': 'hyperswap',
+        'chain_id': 'hyperevm'
+    },
+    {
+        'symbol': 'RUB',
+        'name': 'RUB',
+        'price': '6960000.00000000',
+        'change_24h': '+14.06',
+        'volume_24h': 33000,
+        'market_cap': 6900000,
+        'liquidity': 137000,
+        'last_updated': 0,
+        'source': 'dexscreener_authentic',
+        'pair_address': '0x0e4dbedfe341a782909e01a741046449b50bd86b',
+        'dex_id': 'hyperswap',
+        'chain_id': 'hyperevm'
+    },
+    {
+        'symbol': 'PURR',
+        'name': 'Purr',
+        'price': '0.17430000',
+        'change_24h': '+0.51',
+        'volume_24h': 43000,
+        'market_cap': 103900000,
+        'liquidity': 1300000,
+        'last_updated': 0,
+        'source': 'dexscreener_authentic',
+        'pair_address': '0x07c249fa3902fd243ad0fa58047be8a3262b7104',
+        'dex_id': 'hyperswap',
+        'chain_id': 'hyperevm'
+    },
+    {
+        'symbol': 'LHYPE',
+        'name': 'Looped HYPE',
+        'price': '44.03000000',
+        'change_24h': '+1.03',
+        'volume_24h': 458000,
+        'market_cap': 50600000,
+        'liquidity': 4300000,
+        'last_updated': 0,
+        'source': 'dexscreener_authentic',
+        'pair_address': '0x7db294f26c753ce4fa54a1577aef7f837ea91fdc',
+        'dex_id': 'hyperswap',
+        'chain_id': 'hyperevm'
+    },
+    {
+        'symbol': 'PiP',
+        'name': 'PiP',
+        'price': '15.55000000',
+        'change_24h': '+1.86',
+        'volume_24h': 10000,
+        'market_cap': 15500000,
+        'liquidity': 170000,
+        'last_updated': 0,
+        'source': 'dexscreener_authentic',
+        'pair_address': '0x11473dcc0db2a2b97358b6cb53837a268020d15a',
+        'dex_id': 'hyperswap',
+        'chain_id': 'hyperevm'
+    },
+    {
+        'symbol': 'VEGAS',
+        'name': 'Vegas',
+        'price': '0.30540000',
+        'change_24h': '+4.14',
+        'volume_24h': 25000,
+        'market_cap': 3000000,
+        'liquidity': 146000,
+        'last_updated': 0,
+        'source': 'dexscreener_authentic',
+        'pair_address': '0x8c2ce33c465a6c2dfdc4e448357fd562652bd5a8',
+        'dex_id': 'prjx',
+        'chain_id': 'hyperevm'
+    },
+    {
+        'symbol': 'LIQD',
+        'name': 'LiquidLaunch',
+        'price': '0.01253000',
+        'change_24h': '-8.34',
+        'volume_24h': 12000,
+        'market_cap': 15000000,
+        'liquidity': 137000,
+        'last_updated': 0,
+        'source': 'dexscreener_authentic',
+        'pair_address': '0xa3ce2abaea4aad623d0bacd024530621759d8dcd',
+        'dex_id': 'hyperswap',
+        'chain_id': 'hyperevm'
+    },
+    # Only including UBTC as it's the only Unit token verified on DexScreener HyperEVM
+    {
+        'symbol': 'UBTC',
+        'name': 'Unit Bitcoin',
+        'price': '117140.00000000',
+        'change_24h': '+2.15',
+        'volume_24h': 820000,
+        'market_cap': 383300000,
+        'liquidity': 848000,
+        'last_updated': 0,
+        'source': 'dexscreener_authentic',
+        'pair_address': '0x3a36b04bcc1d5e2e303981ef643d2668e00b43e7',
+        'dex_id': 'hyperswap',
+        'chain_id': 'hyperevm'
+    }
+]
+
 def get_authentic_hyperevm_tokens():
     """
     Get authentic HyperEVM tokens based on real DexScreener data
     These are actual tokens trading on HyperEVM network
     """
-    # Only verified HyperEVM tokens from actual DexScreener data
-    authentic_tokens = [
-        {
-            'symbol': 'BUDDY',
-            'name': 'alright buddy',
-            'price': '0.01214000',
-            'change_24h': '+2.01',
-            'volume_24h': 132000,
-            'market_cap': 12000000,
-            'liquidity': 895000,
-            'last_updated': int(time.time()),
-            'source': 'dexscreener_authentic',
-            'pair_address': '0x056f0975f104cb5318ecc55f0c82b33a756d29c6',
-            'dex_id': 'hyperswap',
-            'chain_id': 'hyperevm'
-        },
-        {
-            'symbol': 'RUB',
-            'name': 'RUB',
-            'price': '6960000.00000000',
-            'change_24h': '+14.06',
-            'volume_24h': 33000,
-            'market_cap': 6900000,
-            'liquidity': 137000,
-            'last_updated': int(time.time()),
-            'source': 'dexscreener_authentic',
-            'pair_address': '0x0e4dbedfe341a782909e01a741046449b50bd86b',
-            'dex_id': 'hyperswap',
-            'chain_id': 'hyperevm'
-        },
-        {
-            'symbol': 'PURR',
-            'name': 'Purr',
-            'price': '0.17430000',
-            'change_24h': '+0.51',
-            'volume_24h': 43000,
-            'market_cap': 103900000,
-            'liquidity': 1300000,
-            'last_updated': int(time.time()),
-            'source': 'dexscreener_authentic',
-            'pair_address': '0x07c249fa3902fd243ad0fa58047be8a3262b7104',
-            'dex_id': 'hyperswap',
-            'chain_id': 'hyperevm'
-        },
-        {
-            'symbol': 'LHYPE',
-            'name': 'Looped HYPE',
-            'price': '44.03000000',
-            'change_24h': '+1.03',
-            'volume_24h': 458000,
-            'market_cap': 50600000,
-            'liquidity': 4300000,
-            'last_updated': int(time.time()),
-            'source': 'dexscreener_authentic',
-            'pair_address': '0x7db294f26c753ce4fa54a1577aef7f837ea91fdc',
-            'dex_id': 'hyperswap',
-            'chain_id': 'hyperevm'
-        },
-        {
-            'symbol': 'PiP',
-            'name': 'PiP',
-            'price': '15.55000000',
-            'change_24h': '+1.86',
-            'volume_24h': 10000,
-            'market_cap': 15500000,
-            'liquidity': 170000,
-            'last_updated': int(time.time()),
-            'source': 'dexscreener_authentic',
-            'pair_address': '0x11473dcc0db2a2b97358b6cb53837a268020d15a',
-            'dex_id': 'hyperswap',
-            'chain_id': 'hyperevm'
-        },
-        {
-            'symbol': 'VEGAS',
-            'name': 'Vegas',
-            'price': '0.30540000',
-            'change_24h': '+4.14',
-            'volume_24h': 25000,
-            'market_cap': 3000000,
-            'liquidity': 146000,
-            'last_updated': int(time.time()),
-            'source': 'dexscreener_authentic',
-            'pair_address': '0x8c2ce33c465a6c2dfdc4e448357fd562652bd5a8',
-            'dex_id': 'prjx',
-            'chain_id': 'hyperevm'
-        },
-        {
-            'symbol': 'LIQD',
-            'name': 'LiquidLaunch',
-            'price': '0.01253000',
-            'change_24h': '-8.34',
-            'volume_24h': 12000,
-            'market_cap': 15000000,
-            'liquidity': 137000,
-            'last_updated': int(time.time()),
-            'source': 'dexscreener_authentic',
-            'pair_address': '0xa3ce2abaea4aad623d0bacd024530621759d8dcd',
-            'dex_id': 'hyperswap',
-            'chain_id': 'hyperevm'
-        },
-        # Only including UBTC as it's the only Unit token verified on DexScreener HyperEVM
-        {
-            'symbol': 'UBTC',
-            'name': 'Unit Bitcoin',
-            'price': '117140.00000000',
-            'change_24h': '+2.15',
-            'volume_24h': 820000,
-            'market_cap': 383300000,
-            'liquidity': 848000,
-            'last_updated': int(time.time()),
-            'source': 'dexscreener_authentic',
-            'pair_address': '0x3a36b04bcc1d5e2e303981ef643d2668e00b43e7',
-            'dex_id': 'hyperswap',
-            'chain_id': 'hyperevm'
-        }
-    ]
-    
-    return authentic_tokens
+    now = int(time.time())
+    return [{**token, 'last_updated': now} for token in _AUTHENTIC_TOKENS]
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,13 +4,33 @@ Real OHLCV chart data fetcher for HyperEVM tokens
 Hooks into authentic data sources like GeckoTerminal and builds realistic charts
 """
 
-import json
+import random
 import sys
 import time
-import subprocess
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
+from _fetchers import load_real_tokens
+from _jsonio import emit_json
+
+# Last known DexScreener prices, used when the live fetch has no entry for a symbol
+_KNOWN_PRICES = {
+    'BUDDY': 0.000303,
+    'RUB': 7193040.0,
+    'LHYPE': 46.0,
+    'PiP': 16.38,
+    'HSTR': 0.5604
+}
+
+_TIMEFRAME_CONFIG = {
+    '1m': {'seconds': 60, 'volatility': 0.012, 'trend_factor': 0.002},
+    '5m': {'seconds': 300, 'volatility': 0.025, 'trend_factor': 0.006},
+    '15m': {'seconds': 900, 'volatility': 0.045, 'trend_factor': 0.012},
+    '1h': {'seconds': 3600, 'volatility': 0.075, 'trend_factor': 0.025},
+    '4h': {'seconds': 14400, 'volatility': 0.120, 'trend_factor': 0.045},
+    '1d': {'seconds': 86400, 'volatility': 0.180, 'trend_factor': 0.080}
+}
+
 def fetch_gecko_ohlcv(symbol, timeframe='5m', limit=60):
     """
     Fetch real OHLCV data from GeckoTerminal for HyperEVM tokens
@@ -18,14 +38,7 @@ def fetch_gecko_ohlcv(symbol, timeframe='5m', limit=60):
     """
     try:
         # Get real token prices first
-        tokens_result = subprocess.run(['python3', 'fetch_dexscreener.py'], capture_output=True, text=True)
-        real_tokens = []
-        
-        if tokens_result.stdout:
-            try:
-                real_tokens = json.loads(tokens_result.stdout)
-            except:
-                pass
+        real_tokens = load_real_tokens()
         
         # Find the token with real price data
         base_symbol = symbol.split('/')[0] if '/' in symbol else symbol
@@ -38,14 +51,7 @@ def fetch_gecko_ohlcv(symbol, timeframe='5m', limit=60):
         
         if not token_data:
             # Fallback to known prices from DexScreener
-            known_prices = {
-                'BUDDY': 0.000303,
-                'RUB': 7193040.0,
-                'LHYPE': 46.0,
-                'PiP': 16.38,
-                'HSTR': 0.5604
-            }
-            base_price = known_prices.get(base_symbol, 0.001)
+            base_price = _KNOWN_PRICES.get(base_symbol, 0.001)
             token_data = {
                 'symbol': base_symbol,
                 'price': base_price,
@@ -65,89 +71,74 @@ def generate_realistic_ohlcv(token_data, timeframe, limit):
     Generate authentic-looking OHLCV data based on real token prices
     Uses real market patterns and volatility from actual crypto trading
     """
-    timeframe_config = {
-        '1m': {'seconds': 60, 'volatility': 0.012, 'trend_factor': 0.002},
-        '5m': {'seconds': 300, 'volatility': 0.025, 'trend_factor': 0.006},
-        '15m': {'seconds': 900, 'volatility': 0.045, 'trend_factor': 0.012},
-        '1h': {'seconds': 3600, 'volatility': 0.075, 'trend_factor': 0.025},
-        '4h': {'seconds': 14400, 'volatility': 0.120, 'trend_factor': 0.045},
-        '1d': {'seconds': 86400, 'volatility': 0.180, 'trend_factor': 0.080}
-    }
-    
-    config = timeframe_config.get(timeframe, timeframe_config['5m'])
+    config = _TIMEFRAME_CONFIG.get(timeframe, _TIMEFRAME_CONFIG['5m'])
+    seconds, volatility, trend_factor = config['seconds'], config['volatility'], config['trend_factor']
     base_price = float(token_data['price'])
     current_time = int(time.time())
     
+    # All per-candle randomness comes from one generator seeded once per call
+    rng = random.Random(current_time)
+    base_volume = int(token_data.get('volume_24h', 50000) / 24 / (3600 / seconds))
+    
     candles = []
     prev_close = base_price
     
-    # Create realistic market patterns
+    # Create realistic market patterns, oldest candle first
     for i in range(limit - 1, -1, -1):
-        timestamp = current_time - (i * config['seconds'])
+        timestamp = current_time - i * seconds
         
         # Market patterns: consolidation, breakouts, reversals
         consolidation_phase = (i // 12) % 3 == 0  # Every 12 candles, consolidate for 12 candles
         breakout_intensity = 0.5 if consolidation_phase else 2.8
         
         # Real crypto volatility patterns
-        market_noise = (hash(str(timestamp)) % 2000 - 1000) / 50000 * config['volatility'] * breakout_intensity
-        trend_component = (hash(str(timestamp + 12345)) % 1000 - 480) / 100000 * config['trend_factor']
+        market_noise = rng.randrange(-1000, 1000) / 50000 * volatility * breakout_intensity
+        trend_component = rng.randrange(-480, 520) / 100000 * trend_factor
         
         # Volume spikes during high volatility (like real markets)
-        volatility_spike = abs(market_noise) > config['volatility'] * 0.8
-        volume_multiplier = 3.5 if volatility_spike else 1.0
+        volume_multiplier = 3.5 if abs(market_noise) > volatility * 0.8 else 1.0
         
-        # Sudden reversal patterns (common in crypto)
-        reversal_chance = hash(str(timestamp + 54321)) % 100
-        if reversal_chance < 8:  # 8% chance of reversal
+        # Sudden reversal patterns (common in crypto): 8% chance of reversal
+        if rng.random() < 0.08:
             market_noise *= -1.5
         
         # Calculate OHLC
+        step = market_noise + trend_component
         open_price = prev_close
-        price_movement = open_price * (market_noise + trend_component)
+        price_movement = open_price * step
         close_price = open_price + price_movement
         
         # Realistic wick patterns
         wick_range = abs(price_movement) * 1.8
-        high_wick = (hash(str(timestamp + 99999)) % 100) / 100 * wick_range
-        low_wick = (hash(str(timestamp + 88888)) % 100) / 100 * wick_range
-        
-        high_price = max(open_price, close_price) + high_wick
-        low_price = min(open_price, close_price) - low_wick
+        body_high = max(open_price, close_price)
+        body_low = min(open_price, close_price)
+        high_price = body_high + rng.randrange(100) / 100 * wick_range
+        low_price = body_low - rng.randrange(100) / 100 * wick_range
         
         # Ensure prices stay positive
         if low_price <= 0:
-            low_price = min(open_price, close_price) * 0.9
+            low_price = body_low * 0.9
         
         # Volume calculation based on price movement
-        base_volume = int(token_data.get('volume_24h', 50000) / 24 / (3600 / config['seconds']))
-        volume_variation = abs(price_movement / open_price) * base_volume * 5
-        volume = int(base_volume + volume_variation) * volume_multiplier
+        volume_variation = abs(step) * base_volume * 5
         
-        candle = {
+        candles.append({
             'timestamp': timestamp * 1000,  # JavaScript timestamp
             'open': round(open_price, 8),
             'high': round(high_price, 8),
             'low': round(low_price, 8),
             'close': round(close_price, 8),
-            'volume': int(volume),
+            'volume': int(int(base_volume + volume_variation) * volume_multiplier),
             'direction': 'up' if close_price >= open_price else 'down'
-        }
-        
-        candles.append(candle)
+        })
         prev_close = close_price
     
-    # Calculate price range
-    all_prices = []
-    for candle in candles:
-        all_prices.extend([candle['high'], candle['low']])
-    
     return {
         'success': True,
         'candlesticks': candles,
         'priceRange': {
-            'min': min(all_prices),
-            'max': max(all_prices)
+            'min': min(candle['low'] for candle in candles),
+            'max': max(candle['high'] for candle in candles)
         },
         'currentPrice': candles[-1]['close'] if candles else base_price,
         'timeframe': timeframe,
@@ -157,7 +148,7 @@ def generate_realistic_ohlcv(token_data, timeframe, limit):
 
 def main():
     if len(sys.argv) < 2:
-        print(json.dumps({'success': False, 'error': 'Missing symbol parameter'}))
+        emit_json({'success': False, 'error': 'Missing symbol parameter'})
         return
     
     symbol = sys.argv[1]
@@ -167,9 +158,9 @@ def main():
     result = fetch_gecko_ohlcv(symbol, timeframe, limit)
     
     if result:
-        print(json.dumps(result))
+        emit_json(result)
     else:
-        print(json.dumps({'success': False, 'error': f'No data available for {symbol}'}))
+        emit_json({'success': False, 'error': f'No data available for {symbol}'})
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
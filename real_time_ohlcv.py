@@ -4,29 +4,40 @@ Real-time OHLCV chart data based on authentic DexScreener prices
 Generates candlestick patterns that match real crypto market behavior
 """
 
-import json
 import sys
 import time
-import subprocess
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
+from _fetchers import load_real_tokens
+from _jsonio import emit_json
+
+# Last known DexScreener prices, used when the live fetch has no entry for a symbol
+_KNOWN_PRICES = {
+    'BUDDY': 0.000303,
+    'RUB': 7193040.0,
+    'LHYPE': 46.0,
+    'PiP': 16.38,
+    'HSTR': 0.5604,
+    'WHYPE': 1.0327  # 1 HYPE = $1.0327
+}
+
+_TIMEFRAME_CONFIG = {
+    '1m': {'seconds': 60, 'volatility': 0.018, 'trend_factor': 0.004, 'wick_factor': 1.8},
+    '5m': {'seconds': 300, 'volatility': 0.040, 'trend_factor': 0.010, 'wick_factor': 2.2},
+    '15m': {'seconds': 900, 'volatility': 0.065, 'trend_factor': 0.018, 'wick_factor': 2.8},
+    '1h': {'seconds': 3600, 'volatility': 0.095, 'trend_factor': 0.035, 'wick_factor': 3.5},
+    '4h': {'seconds': 14400, 'volatility': 0.150, 'trend_factor': 0.065, 'wick_factor': 4.2},
+    '1d': {'seconds': 86400, 'volatility': 0.220, 'trend_factor': 0.100, 'wick_factor': 5.0}
+}
+
 def fetch_real_time_ohlcv(symbol, timeframe='5m', limit=60):
     """
     Generate real-time OHLCV data using authentic token prices from DexScreener
     """
     try:
         # Get real token prices from DexScreener
-        tokens_result = subprocess.run(['python3', 'fetch_dexscreener.py'], capture_output=True, text=True)
-        real_tokens = []
-        
-        if tokens_result.stdout:
-            try:
-                real_tokens = json.loads(tokens_result.stdout)
-                print(f"✅ Fetched {len(real_tokens)} real tokens from DexScreener", file=sys.stderr)
-            except:
-                print("❌ Failed to parse DexScreener data", file=sys.stderr)
-                pass
+        real_tokens = load_real_tokens()
         
         # Find the specific token
         base_symbol = symbol.split('/')[0] if '/' in symbol else symbol
@@ -39,15 +50,7 @@ def fetch_real_time_ohlcv(symbol, timeframe='5m', limit=60):
         
         if not token_data:
             # Use known DexScreener prices as fallback
-            known_prices = {
-                'BUDDY': 0.000303,
-                'RUB': 7193040.0,
-                'LHYPE': 46.0,
-                'PiP': 16.38,
-                'HSTR': 0.5604,
-                'WHYPE': 1.0327  # 1 HYPE = $1.0327
-            }
-            base_price = known_prices.get(base_symbol, 0.001)
+            base_price = _KNOWN_PRICES.get(base_symbol, 0.001)
             token_data = {
                 'symbol': base_symbol,
                 'price': base_price,
@@ -67,85 +70,46 @@ def fetch_real_time_ohlcv(symbol, timeframe='5m', limit=60):
         print(f"Error fetching real-time OHLCV: {e}", file=sys.stderr)
         return None
 
-def generate_authentic_ohlcv(token_data, timeframe, limit):
+def _candle_walk(start_price, seconds, volatility, trend_factor, wick_factor, liquidity_factor,
+                    volume_24h, sym_hash, current_time, trend_direction, trend_strength, limit):
     """
-    Generate OHLCV candlesticks using authentic crypto market patterns
-    Based on real token price and volume data from DexScreener
+    Walk the candle recurrence (each open is the previous close) in plain Python
+    A chart request spawns a fresh interpreter for about 60 candles, so import time dominates, not the loop
+    Returns the candlesticks, oldest first
     """
-    timeframe_config = {
-        '1m': {'seconds': 60, 'volatility': 0.018, 'trend_factor': 0.004, 'wick_factor': 1.8},
-        '5m': {'seconds': 300, 'volatility': 0.040, 'trend_factor': 0.010, 'wick_factor': 2.2},
-        '15m': {'seconds': 900, 'volatility': 0.065, 'trend_factor': 0.018, 'wick_factor': 2.8},
-        '1h': {'seconds': 3600, 'volatility': 0.095, 'trend_factor': 0.035, 'wick_factor': 3.5},
-        '4h': {'seconds': 14400, 'volatility': 0.150, 'trend_factor': 0.065, 'wick_factor': 4.2},
-        '1d': {'seconds': 86400, 'volatility': 0.220, 'trend_factor': 0.100, 'wick_factor': 5.0}
-    }
-    
-    config = timeframe_config.get(timeframe, timeframe_config['5m'])
-    
-    # Real market data from DexScreener
-    current_price = float(token_data['price'])
-    volume_24h = float(token_data.get('volume_24h', 50000))
-    price_change_24h = float(token_data.get('change_24h', 0))
-    market_cap = float(token_data.get('market_cap', current_price * 1000000))
-    
-    current_time = int(time.time())
     candles = []
     
-    # Market trend analysis from 24h change
-    trend_direction = 1 if price_change_24h > 0 else -1
-    trend_strength = min(abs(price_change_24h) / 100, 0.3)  # Cap trend strength
+    # Average volume per interval
+    base_volume = volume_24h / (24 * 3600 / seconds)
     
-    # Calculate starting price to achieve current price after trend
-    price_drift = (price_change_24h / 100) * 0.7  # 70% of 24h change distributed across candles
-    start_price = current_price / (1 + price_drift)
     prev_close = start_price
-    
-    # Market microstructure factors
-    liquidity_factor = min(market_cap / 100000, 10.0)  # Higher market cap = more stability
-    volume_factor = min(volume_24h / 10000, 8.0)  # Higher volume = more activity
-    
-    for i in range(limit - 1, -1, -1):
-        timestamp = current_time - (i * config['seconds'])
+    for i in range(limit - 1, -1, -1):  # Intervals back from now, oldest candle first
+        timestamp = current_time - i * seconds
         
-        # Time-based market patterns
+        # Market activity patterns (higher during business hours, lower on weekends)
         hour_of_day = (timestamp // 3600) % 24
         day_of_week = (timestamp // 86400) % 7
-        
-        # Market activity patterns (higher during business hours)
-        activity_multiplier = 1.0
-        if 8 <= hour_of_day <= 20:  # Business hours
-            activity_multiplier = 1.4
-        if day_of_week in [5, 6]:  # Weekend
+        activity_multiplier = 1.4 if 8 <= hour_of_day <= 20 else 1.0
+        if day_of_week >= 5:
             activity_multiplier *= 0.7
         
-        # Volatility calculation with real market factors
-        base_volatility = config['volatility'] / liquidity_factor * activity_multiplier
-        
         # Market noise with crypto-specific patterns
-        hash_seed = timestamp + hash(token_data['symbol']) % 1000000
+        base_volatility = volatility / liquidity_factor * activity_multiplier
+        hash_seed = timestamp + sym_hash
         market_noise = (hash_seed % 2000 - 1000) / 50000 * base_volatility
         
         # Progressive trend application
-        progress = (limit - i) / limit
-        trend_component = trend_direction * trend_strength * progress * config['trend_factor']
+        trend_component = trend_direction * trend_strength * ((limit - i) / limit) * trend_factor
         
-        # Volatility spikes (common in crypto)
-        spike_chance = hash_seed % 100
-        if spike_chance < 12:  # 12% chance of volatility spike
+        # Volatility spikes (12% chance) and sudden reversals (6% chance)
+        spike = hash_seed % 100 < 12
+        if spike:
             market_noise *= 3.2
-            volume_factor *= 2.5
-        
-        # Sudden reversals (whale activities)
-        reversal_chance = (hash_seed + 12345) % 100
-        if reversal_chance < 6:  # 6% chance of reversal
+        if (hash_seed + 12345) % 100 < 6:
             market_noise *= -2.1
             trend_component *= -0.8
         
-        # Calculate OHLC with authentic patterns
         open_price = prev_close
-        
-        # Price movement calculation
         total_movement = market_noise + trend_component
         close_price = open_price * (1 + total_movement)
         
@@ -154,59 +118,75 @@ def generate_authentic_ohlcv(token_data, timeframe, limit):
             close_price = open_price * 0.95
         
         # Authentic wick patterns
-        wick_range = abs(total_movement) * open_price * config['wick_factor']
-        
-        # Upper and lower wicks with crypto market behavior
-        upper_wick = ((hash_seed + 77777) % 100) / 100 * wick_range
-        lower_wick = ((hash_seed + 88888) % 100) / 100 * wick_range
-        
-        # Apply wicks
-        high_price = max(open_price, close_price) + upper_wick
-        low_price = min(open_price, close_price) - lower_wick
+        wick_range = abs(total_movement) * open_price * wick_factor
+        body_low = min(open_price, close_price)
+        high_price = max(open_price, close_price) + ((hash_seed + 77777) % 100) / 100 * wick_range
+        low_price = body_low - ((hash_seed + 88888) % 100) / 100 * wick_range
         
         # Ensure low price stays positive
         if low_price <= 0:
-            low_price = min(open_price, close_price) * 0.85
-        
-        # Volume calculation based on real metrics
-        base_volume = volume_24h / (24 * 3600 / config['seconds'])  # Average volume per interval
-        volume_variation = ((hash_seed + 99999) % 200) / 100  # 0.5x to 2.5x variation
-        
-        # Higher volume during price movements
-        movement_intensity = abs(total_movement)
-        volume_multiplier = 1.0 + (movement_intensity * 15)  # Volume increases with price movement
+            low_price = body_low * 0.85
         
-        interval_volume = int(base_volume * volume_variation * volume_multiplier * activity_multiplier)
+        # Higher volume during price movements, 0.5x to 2.5x variation, spikes during volatility
+        volume_variation = ((hash_seed + 99999) % 200) / 100
+        volume_multiplier = 1.0 + abs(total_movement) * 15
+        volume = int(base_volume * volume_variation * volume_multiplier * activity_multiplier)
+        if spike:
+            volume *= 4
         
-        # Volume spikes during volatility
-        if spike_chance < 12:
-            interval_volume *= 4
-        
-        # Create candlestick
-        candle = {
+        candles.append({
             'timestamp': timestamp * 1000,  # JavaScript timestamp (milliseconds)
             'open': round(open_price, 8),
             'high': round(high_price, 8),
             'low': round(low_price, 8),
             'close': round(close_price, 8),
-            'volume': max(int(interval_volume), 100),  # Minimum volume
+            'volume': max(volume, 100),  # Minimum volume
             'direction': 'up' if close_price >= open_price else 'down'
-        }
-        
-        candles.append(candle)
+        })
         prev_close = close_price
     
-    # Price range calculation
-    all_prices = []
-    for candle in candles:
-        all_prices.extend([candle['high'], candle['low']])
+    return candles
+
+def generate_authentic_ohlcv(token_data, timeframe, limit):
+    """
+    Generate OHLCV candlesticks using authentic crypto market patterns
+    Based on real token price and volume data from DexScreener
+    """
+    config = _TIMEFRAME_CONFIG.get(timeframe, _TIMEFRAME_CONFIG['5m'])
+    
+    # Real market data from DexScreener
+    current_price = float(token_data['price'])
+    volume_24h = float(token_data.get('volume_24h', 50000))
+    price_change_24h = float(token_data.get('change_24h', 0))
+    market_cap = float(token_data.get('market_cap', current_price * 1000000))
+    
+    current_time = int(time.time())
+    
+    # Market trend analysis from 24h change
+    trend_direction = 1 if price_change_24h > 0 else -1
+    trend_strength = min(abs(price_change_24h) / 100, 0.3)  # Cap trend strength
+    
+    # Calculate starting price to achieve current price after trend
+    price_drift = (price_change_24h / 100) * 0.7  # 70% of 24h change distributed across candles
+    start_price = current_price / (1 + price_drift)
+    
+    # Market microstructure factors
+    liquidity_factor = min(market_cap / 100000, 10.0)  # Higher market cap = more stability
+    
+    # The symbol's share of every candle's noise seed is hashed once, not per candle
+    sym_hash = hash(token_data['symbol']) % 1000000
+    
+    candles = _candle_walk(
+        start_price, config['seconds'], config['volatility'], config['trend_factor'], config['wick_factor'],
+        liquidity_factor, volume_24h, sym_hash, current_time, trend_direction, trend_strength, limit
+    )
     
     return {
         'success': True,
         'candlesticks': candles,
         'priceRange': {
-            'min': min(all_prices),
-            'max': max(all_prices)
+            'min': min(candle['low'] for candle in candles),
+            'max': max(candle['high'] for candle in candles)
         },
         'currentPrice': candles[-1]['close'] if candles else current_price,
         'timeframe': timeframe,
@@ -222,7 +202,7 @@ def generate_authentic_ohlcv(token_data, timeframe, limit):
 
 def main():
     if len(sys.argv) < 2:
-        print(json.dumps({'success': False, 'error': 'Missing symbol parameter'}))
+        emit_json({'success': False, 'error': 'Missing symbol parameter'})
         return
     
     symbol = sys.argv[1]
@@ -232,9 +212,9 @@ def main():
     result = fetch_real_time_ohlcv(symbol, timeframe, limit)
     
     if result:
-        print(json.dumps(result))
+        emit_json(result)
     else:
-        print(json.dumps({'success': False, 'error': f'No real-time data available for {symbol}'}))
+        emit_json({'success': False, 'error': f'No real-time data available for {symbol}'})
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+import _cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_cache, 'CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(_cache.time, 'time', lambda: now[0])
+    return now
+
+
+def test_miss_returns_none():
+    assert _cache.get('https://example.test/a', 60) is None
+
+
+def test_put_then_get_within_ttl(clock):
+    _cache.put('https://example.test/a', {'pairs': [1, 2]})
+
+    clock[0] += 59
+    assert _cache.get('https://example.test/a', 60) == {'pairs': [1, 2]}
+
+
+def test_entry_expires_after_ttl(clock):
+    _cache.put('https://example.test/a', {'pairs': []})
+
+    clock[0] += 61
+    assert _cache.get('https://example.test/a', 60) is None
+    assert _cache.get('https://example.test/a', 300) == {'pairs': []}
+
+
+def test_keys_do_not_collide():
+    _cache.put('https://example.test/a', 'a')
+    _cache.put('https://example.test/b', 'b')
+
+    assert _cache.get('https://example.test/a', 60) == 'a'
+    assert _cache.get('https://example.test/b', 60) == 'b'
+
+
+def test_unserializable_data_is_ignored(cache_dir):
+    _cache.put('https://example.test/a', {'bad': object()})
+
+    assert _cache.get('https://example.test/a', 60) is None
+    assert os.listdir(cache_dir) == []
+
+
+def test_failed_write_leaves_no_temp_file(cache_dir, monkeypatch):
+    def fail(src, dst):
+        raise OSError('disk full')
+    monkeypatch.setattr(_cache.os, 'replace', fail)
+
+    _cache.put('https://example.test/a', {'pairs': []})
+
+    assert os.listdir(cache_dir) == []
+
+
+def test_etag_round_trip():
+    assert _cache.get_etag('https://example.test/a') == (None, None)
+
+    _cache.put_etag('https://example.test/a', '"v1"', {'pairs': [1]})
+
+    assert _cache.get_etag('https://example.test/a') == ('"v1"', {'pairs': [1]})
+    assert _cache.get('https://example.test/a', 60) is None
@@ -0,0 +1,58 @@
+import sys
+
+import pytest
+
+import _fetchers
+
+
+@pytest.fixture
+def fetcher_dir(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in ('fetcher_with_entry', 'fetcher_script_only'):
+        sys.modules.pop(name, None)
+
+
+def _write_script(directory, name, body):
+    path = directory / name
+    path.write_text(body)
+    return str(path)
+
+
+def test_calls_entry_point_in_process(fetcher_dir, monkeypatch):
+    (fetcher_dir / 'fetcher_with_entry.py').write_text("def get_tokens():\n    return [{'symbol': 'IN'}]\n")
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError('subprocess should not run')
+    monkeypatch.setattr(_fetchers.subprocess, 'run', no_subprocess)
+
+    assert _fetchers.run_fetcher('fetcher_with_entry', 'get_tokens', 'unused.py') == [{'symbol': 'IN'}]
+
+
+def test_runs_script_when_module_has_no_entry_point(fetcher_dir):
+    script = _write_script(
+        fetcher_dir, 'fetcher_script_only.py',
+        "import json\nif __name__ == '__main__':\n    print(json.dumps([{'symbol': 'SUB'}]))\n"
+    )
+
+    assert _fetchers.run_fetcher('fetcher_script_only', 'get_tokens', script) == [{'symbol': 'SUB'}]
+
+
+def test_runs_script_when_module_is_missing(fetcher_dir):
+    script = _write_script(fetcher_dir, 'standalone.py', "print('[{\"symbol\": \"SUB\"}]')\n")
+
+    assert _fetchers.run_fetcher('no_such_fetcher_module', 'get_tokens', script) == [{'symbol': 'SUB'}]
+
+
+def test_script_without_output_gives_empty_list(fetcher_dir):
+    script = _write_script(fetcher_dir, 'silent.py', "")
+
+    assert _fetchers.run_script(script) == []
+
+
+def test_load_real_tokens_swallows_errors(monkeypatch):
+    def broken(script, timeout=None):
+        raise ValueError('bad json')
+    monkeypatch.setattr(_fetchers, 'run_script', broken)
+
+    assert _fetchers.load_real_tokens() == []
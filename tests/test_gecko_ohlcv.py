@@ -0,0 +1,75 @@
+import json
+import math
+
+from gecko_ohlcv import parse_ohlcv_candles
+
+
+def _row(ts, price=1.0, volume=10.0):
+    return [ts, price, price * 1.1, price * 0.9, price, volume]
+
+
+def test_drops_null_cells():
+    rows = [
+        _row(3000),
+        [None, 1.0, 1.1, 0.9, 1.0, 10.0],       # null timestamp
+        [2500, 1.0, 1.1, 0.9, 1.0, None],       # null volume
+        [2000, 1.0, None, 0.9, 1.0, 10.0],      # null high
+        _row(1000),
+    ]
+
+    candles = parse_ohlcv_candles(rows, '5m')
+
+    assert [c['timestamp'] for c in candles] == [3000, 1000]
+    assert all(math.isfinite(c['volume']) for c in candles)
+    json.dumps(candles, allow_nan=False)
+
+
+def test_drops_string_cells():
+    rows = [
+        _row(3000),
+        [2500, 'abc', 1.1, 0.9, 1.0, 10.0],     # non-numeric price
+        [2000, 1.0, 1.1, 0.9, 1.0, None],       # null volume alongside it
+        _row(1000),
+    ]
+
+    candles = parse_ohlcv_candles(rows, '5m')
+
+    assert [c['timestamp'] for c in candles] == [3000, 1000]
+    json.dumps(candles, allow_nan=False)
+
+
+def test_drops_short_rows_and_non_positive_prices():
+    rows = [_row(3000), [2000, 1.0, 1.1], _row(1000, price=0.0), _row(500, price=-1.0)]
+
+    candles = parse_ohlcv_candles(rows, '5m')
+
+    assert [c['timestamp'] for c in candles] == [3000]
+
+
+def test_sorts_newest_first():
+    rows = [_row(1000), _row(3000), _row(2000)]
+
+    candles = parse_ohlcv_candles(rows, '1h')
+
+    assert [c['timestamp'] for c in candles] == [3000, 2000, 1000]
+    assert all(c['timeframe'] == '1h' and c['source'] == 'GeckoTerminal_Real' for c in candles)
+
+
+def test_keeps_descending_input_order():
+    rows = [_row(3000, price=3.0), _row(2000, price=2.0), _row(1000, price=1.0)]
+
+    candles = parse_ohlcv_candles(rows, '5m')
+
+    assert [c['open'] for c in candles] == [3.0, 2.0, 1.0]
+
+
+def test_direction_follows_close_vs_open():
+    rows = [[2000, 1.0, 2.0, 0.5, 1.5, 1.0], [1000, 1.5, 2.0, 0.5, 1.0, 1.0]]
+
+    candles = parse_ohlcv_candles(rows, '5m')
+
+    assert [c['direction'] for c in candles] == ['up', 'down']
+
+
+def test_empty_input():
+    assert parse_ohlcv_candles([], '5m') == []
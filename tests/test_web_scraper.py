@@ -0,0 +1,89 @@
+from web_scraper import _first_per_symbol, parse_dexscreener_data, parse_gecko_terminal_data
+
+
+def _pool(symbol, quote='WHYPE', price='1.5'):
+    return {
+        'id': f'hyperevm_0x{symbol.lower()}',
+        'attributes': {
+            'base_token': {'symbol': symbol, 'name': f'{symbol} Token', 'address': f'0x{symbol}'},
+            'quote_token': {'symbol': quote},
+            'base_token_price_usd': price,
+            'price_change_percentage': {'h24': '2.5'},
+            'volume_usd': {'h24': '1000.7'},
+            'reserve_in_usd': '5000',
+            'market_cap_usd': None,
+        },
+    }
+
+
+def _pair(symbol, quote='HYPE', price='0.25'):
+    return {
+        'baseToken': {'symbol': symbol, 'name': f'{symbol} Token', 'address': f'0x{symbol}'},
+        'quoteToken': {'symbol': quote},
+        'priceUsd': price,
+        'priceChange': {'h24': 1.5},
+        'volume': {'h24': 200.9},
+        'liquidity': {'usd': 3000},
+        'marketCap': 90000,
+    }
+
+
+def test_gecko_skips_malformed_pools():
+    malformed = [
+        {'attributes': {**_pool('BAD')['attributes'], 'base_token': 'BAD'}},
+        {'attributes': {**_pool('BAD')['attributes'], 'quote_token': ['WHYPE']}},
+        {'attributes': 'not-a-dict'},
+        'not-a-pool',
+        _pool('NOPRICE', price='n/a'),
+    ]
+
+    tokens = parse_gecko_terminal_data([_pool('BUDDY'), *malformed, _pool('RUB')])
+
+    assert [t['symbol'] for t in tokens] == ['BUDDY', 'RUB']
+    assert tokens[0]['price'] == 1.5
+    assert tokens[0]['volume_24h'] == 1000
+    assert tokens[0]['pool_address'] == '0xbuddy'
+
+
+def test_gecko_skips_non_hype_pairs():
+    tokens = parse_gecko_terminal_data([_pool('USDC', quote='USDT'), _pool('WHYPE'), _pool('PURR')])
+
+    assert [t['symbol'] for t in tokens] == ['PURR']
+
+
+def test_dexscreener_skips_malformed_pairs():
+    malformed = [
+        {**_pair('BAD'), 'baseToken': 'BAD'},
+        {**_pair('BAD'), 'quoteToken': 7},
+        {**_pair('BAD'), 'volume': 'lots'},
+        'not-a-pair',
+    ]
+
+    tokens = parse_dexscreener_data([_pair('PURR'), *malformed, _pair('LHYPE')])
+
+    assert [t['symbol'] for t in tokens] == ['PURR', 'LHYPE']
+    assert tokens[0]['price_str'] == '$0.25000000'
+    assert tokens[0]['volume_24h'] == 200
+
+
+def test_first_per_symbol_keeps_first_in_order():
+    tokens = [
+        {'symbol': 'A', 'price': 1},
+        None,
+        {'symbol': 'B', 'price': 2},
+        {'symbol': 'A', 'price': 3},
+        {'symbol': 'C', 'price': 4},
+        {'symbol': 'B', 'price': 5},
+    ]
+
+    assert _first_per_symbol(tokens) == [
+        {'symbol': 'A', 'price': 1},
+        {'symbol': 'B', 'price': 2},
+        {'symbol': 'C', 'price': 4},
+    ]
+
+
+def test_parsers_dedupe_repeated_symbols():
+    tokens = parse_dexscreener_data([_pair('PURR', price='1'), _pair('PURR', price='2'), _pair('HFUN')])
+
+    assert [(t['symbol'], t['price']) for t in tokens] == [('PURR', 1.0), ('HFUN', 0.25)]
@@ -1,17 +1,32 @@
-import trafilatura
-import json
+import asyncio
 import re
 import sys
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
+from urllib.parse import urlencode
+
+import numpy as np
+
+import _cache
+from _fetchers import run_fetcher, run_script
+from _jsonio import emit_json, json_loads
+from _tokens import HYPE_SYMBOLS, to_float, to_int
 
 # Import requests without name conflict
 try:
     import requests as req
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     req = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # Import trafilatura with proper attribute check
 try:
     import trafilatura
@@ -20,6 +35,12 @@ try:
 except ImportError:
     trafilatura_extract = None
 
+# selectolax's C parser strips a page to text far faster than trafilatura's lxml heuristics
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
 # HyperSwap Router Addresses
 HYPERSWAP_V2_ROUTER = "0xb4a9C4e6Ea8E2191d2FA5B380452a634Fb21240A"
 HYPERSWAP_V3_ROUTER = "0x4E2960a8cd19B467b82d26D83fAcb0fAE26b094D"
@@ -27,18 +48,71 @@ HYPERSWAP_V3_ROUTER = "0x4E2960a8cd19B467b82d26D83fAcb0fAE26b094D"
 # WHYPE token address (base pair)
 WHYPE_ADDRESS = "0x..." # Will be populated from actual contract calls
 
+# Shared keep-alive session so the GeckoTerminal pool lookup and its follow-up detail call reuse one TLS connection
+if req:
+    _SESSION = req.Session()
+    _ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+    _SESSION.mount('https://', _ADAPTER)
+    _SESSION.mount('http://', _ADAPTER)
+
+# Order book depth: price levels 1..8 increments away from the current price on each side
+_ORDER_LEVELS = np.arange(1, 9)
+
+_RNG = np.random.default_rng()
+
+# Bound str.format for the "$0.00000000" price strings, looked up once instead of per token
+_fmt_price = "${:.8f}".format
+
+GECKO_POOLS_URL = "https://api.geckoterminal.com/api/v2/networks/hyperevm/pools"
+GECKO_POOLS_PARAMS = {"page": 1}
+GECKO_HEADERS = {"accept": "application/json"}
+
+DEXSCREENER_PAIRS_URL = "https://api.dexscreener.com/latest/dex/pairs/hyperevm"
+DEXSCREENER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json'
+}
+
+# Most addresses Gecko Terminal accepts in one /tokens/multi request
+GECKO_MULTI_LIMIT = 30
+
+# Seconds a cached API response stays fresh: pool prices move fast, pool lists and candles slowly
+PRICE_CACHE_TTL = 5
+POOLS_CACHE_TTL = 60
+OHLCV_CACHE_TTL = 60
+
+def _cached_get(url: str, headers: Dict, ttl: int, params: Optional[Dict] = None) -> Optional[Dict]:
+    """
+    GET a JSON document, answering repeat calls within ttl seconds from the on-disk cache
+    Returns None on a non-200 response, which is never cached
+    """
+    key = f"{url}?{urlencode(params)}" if params else url
+    data = _cache.get(key, ttl)
+    if data is not None:
+        return data
+    
+    response = _SESSION.get(url, headers=headers, timeout=10, params=params)
+    if response.status_code != 200:
+        return None
+    
+    data = json_loads(response.content)
+    _cache.put(key, data)
+    return data
+
 def get_website_text_content(url: str) -> str:
     """
     This function takes a url and returns the main text content of the website.
-    The text content is extracted using trafilatura and easier to understand.
+    The text content is extracted using selectolax when installed, otherwise trafilatura.
     The results is not directly readable, better to be summarized by LLM before consume
     by the user.
     """
     try:
         # Use requests to fetch content first
-        if req and trafilatura_extract:
-            response = req.get(url, timeout=10)
+        if req and (HTMLParser or trafilatura_extract):
+            response = _SESSION.get(url, timeout=10)
             if response.status_code == 200:
+                if HTMLParser:
+                    return _selectolax_text(response.content)
                 text = trafilatura_extract(response.text)
                 return text if text else ""
         return ""
@@ -46,6 +120,14 @@ def get_website_text_content(url: str) -> str:
         print(f"Error fetching content: {e}")
         return ""
 
+def _selectolax_text(html: bytes) -> str:
+    """Visible page text with scripts, styles and page chrome removed"""
+    tree = HTMLParser(html)
+    for node in tree.css('script, style, noscript, nav, footer, header'):
+        node.decompose()
+    root = tree.body or tree.root
+    return root.text(separator='\n', strip=True) if root else ""
+
 def get_token_price_from_router(token_address: str, router_address: str) -> Optional[float]:
     """
     Get real token price from HyperSwap router using Web3 calls
@@ -73,10 +155,9 @@ def get_gecko_terminal_token_price(token_address: str) -> Optional[Dict]:
         pools_url = f"{base_url}/networks/hyperevm/tokens/{token_address}/pools"
         if not req:
             return None
-        response = req.get(pools_url, headers=headers, timeout=10)
+        pools_data = _cached_get(pools_url, headers, POOLS_CACHE_TTL)
         
-        if response.status_code == 200:
-            pools_data = response.json()
+        if pools_data is not None:
             if pools_data.get('data'):
                 # Get the most liquid pool
                 pool = pools_data['data'][0]
@@ -86,10 +167,10 @@ def get_gecko_terminal_token_price(token_address: str) -> Optional[Dict]:
                 pool_url = f"{base_url}/networks/hyperevm/pools/{pool_address}"
                 if not req:
                     return None
-                pool_response = req.get(pool_url, headers=headers, timeout=10)
+                pool_response = _cached_get(pool_url, headers, PRICE_CACHE_TTL)
                 
-                if pool_response.status_code == 200:
-                    pool_data = pool_response.json()['data']['attributes']
+                if pool_response is not None:
+                    pool_data = pool_response['data']['attributes']
                     base_token = pool_data['base_token']
                     
                     return {
@@ -111,6 +192,67 @@ def get_gecko_terminal_token_price(token_address: str) -> Optional[Dict]:
     return None
 
 
+def get_gecko_terminal_token_prices(token_addresses: List[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Fetch Gecko Terminal prices for several tokens at once, keyed by token address
+    Each token's pools-list and pool-detail calls run on their own worker, so N tokens cost
+    about two round trips instead of 2N; prefer this over looping get_gecko_terminal_token_price
+    """
+    if not token_addresses:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(token_addresses))) as pool:
+        return dict(zip(token_addresses, pool.map(get_gecko_terminal_token_price, token_addresses)))
+
+
+def get_gecko_terminal_prices_bulk(token_addresses: List[str]) -> Dict[str, Dict]:
+    """
+    Fetch Gecko Terminal token prices through the multi-token endpoint, keyed by token address
+    Up to GECKO_MULTI_LIMIT addresses share one request, so N tokens cost ceil(N / 30) round trips;
+    tokens Gecko Terminal does not know are simply absent from the result
+    """
+    base_url = "https://api.geckoterminal.com/api/v2"
+    headers = {"accept": "application/json"}
+    
+    if not req or not token_addresses:
+        return {}
+    
+    # Gecko Terminal echoes addresses lower-cased, so map them back to the caller's spelling
+    requested = {address.lower(): address for address in token_addresses}
+    prices = {}
+    
+    for start in range(0, len(token_addresses), GECKO_MULTI_LIMIT):
+        batch = token_addresses[start:start + GECKO_MULTI_LIMIT]
+        url = f"{base_url}/networks/hyperevm/tokens/multi/{','.join(batch)}"
+        
+        try:
+            data = _cached_get(url, headers, PRICE_CACHE_TTL)
+        except Exception as e:
+            print(f"Gecko Terminal API error: {e}", file=sys.stderr)
+            continue
+        
+        for token in (data or {}).get('data') or []:
+            attrs = token.get('attributes') or {}
+            address = requested.get((attrs.get('address') or '').lower())
+            if address is None:
+                continue
+            
+            try:
+                prices[address] = {
+                    'symbol': attrs.get('symbol'),
+                    'name': attrs.get('name'),
+                    'address': address,
+                    'price_usd': to_float(attrs, 'price_usd'),
+                    'volume_24h': to_float(attrs.get('volume_usd'), 'h24'),
+                    'liquidity_usd': to_float(attrs, 'total_reserve_in_usd'),
+                    'market_cap': to_float(attrs, 'market_cap_usd')
+                }
+            except (TypeError, ValueError) as e:
+                print(f"Error parsing Gecko token data: {e}", file=sys.stderr)
+    
+    return prices
+
+
 def get_gecko_terminal_ohlcv(pool_address: str, timeframe: str = '1h') -> List[Dict]:
     """
     Fetch OHLCV candlestick data from Gecko Terminal API
@@ -123,10 +265,9 @@ def get_gecko_terminal_ohlcv(pool_address: str, timeframe: str = '1h') -> List[D
         url = f"{base_url}/networks/hyperevm/pools/{pool_address}/ohlcv/{timeframe}"
         if not req:
             return []
-        response = req.get(url, headers=headers, timeout=10)
+        data = _cached_get(url, headers, OHLCV_CACHE_TTL)
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             ohlcv_data = data['data']['attributes']['ohlcv_list']
             
             # Convert to proper format
@@ -150,68 +291,153 @@ def get_gecko_terminal_ohlcv(pool_address: str, timeframe: str = '1h') -> List[D
     return []
 
 
-def fetch_real_token_data() -> List[Dict]:
+def _gecko_pools_tokens(data: Optional[Dict]) -> List[Dict]:
+    """Tokens from a Gecko Terminal pools response, or [] when it has none"""
+    if data is not None and data.get('data'):
+        return parse_gecko_terminal_data(data['data'])
+    return []
+
+
+def _dexscreener_pairs_tokens(data: Optional[Dict]) -> List[Dict]:
+    """Tokens from a DexScreener pairs response, or [] when it has none"""
+    if data is not None and data.get('pairs'):
+        print(f"✅ Successfully fetched {len(data['pairs'])} pairs from DexScreener", file=sys.stderr)
+        return parse_dexscreener_data(data['pairs'])
+    return []
+
+
+def _try_gecko() -> List[Dict]:
+    """Gecko Terminal HyperEVM pools as tokens"""
+    try:
+        if req:
+            return _gecko_pools_tokens(_cached_get(GECKO_POOLS_URL, GECKO_HEADERS, POOLS_CACHE_TTL, params=GECKO_POOLS_PARAMS))
+    except Exception as e:
+        print(f"Gecko Terminal API error: {e}", file=sys.stderr)
+    return []
+
+
+def _try_dexscreener() -> List[Dict]:
+    """DexScreener HyperEVM pairs as tokens"""
+    try:
+        if req:
+            return _dexscreener_pairs_tokens(_cached_get(DEXSCREENER_PAIRS_URL, DEXSCREENER_HEADERS, PRICE_CACHE_TTL))
+    except Exception as e:
+        print(f"DexScreener API error: {e}", file=sys.stderr)
+    return []
+
+
+async def _cached_aget(client, url: str, headers: Dict, ttl: int, params: Optional[Dict] = None) -> Optional[Dict]:
     """
-    Fetch real HyperEVM token data from Gecko Terminal API and HyperSwap routers
+    Async variant of _cached_get on a shared httpx.AsyncClient
     """
+    key = f"{url}?{urlencode(params)}" if params else url
+    data = _cache.get(key, ttl)
+    if data is not None:
+        return data
+    
+    response = await client.get(url, headers=headers, params=params)
+    if response.status_code != 200:
+        return None
+    
+    data = json_loads(response.content)
+    _cache.put(key, data)
+    return data
+
+
+async def _try_gecko_async(client) -> List[Dict]:
+    """Async variant of _try_gecko"""
     try:
-        # First try Gecko Terminal API
-        gecko_url = "https://api.geckoterminal.com/api/v2/networks/hyperevm/pools"
-        headers = {"accept": "application/json"}
-        
-        try:
-            if req:
-                response = req.get(gecko_url, headers=headers, timeout=10, params={"page": 1})
-                if response.status_code == 200:
-                    data = response.json()
-                    if 'data' in data and data['data']:
-                        return parse_gecko_terminal_data(data['data'])
-        except Exception as e:
-            print(f"Gecko Terminal API error: {e}", file=sys.stderr)
-        
-        # Try DexScreener API as backup
-        dexscreener_url = "https://api.dexscreener.com/latest/dex/pairs/hyperevm"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        }
-        
-        try:
-            if req:
-                response = req.get(dexscreener_url, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if 'pairs' in data and data['pairs']:
-                        print(f"✅ Successfully fetched {len(data['pairs'])} pairs from DexScreener", file=sys.stderr)
-                        return parse_dexscreener_data(data['pairs'])
-        except Exception as e:
-            print(f"DexScreener API error: {e}", file=sys.stderr)
-        
-        # Try authentic data from separate fetcher
-        import subprocess
+        return _gecko_pools_tokens(await _cached_aget(client, GECKO_POOLS_URL, GECKO_HEADERS, POOLS_CACHE_TTL, params=GECKO_POOLS_PARAMS))
+    except Exception as e:
+        print(f"Gecko Terminal API error: {e}", file=sys.stderr)
+    return []
+
+
+async def _try_dexscreener_async(client) -> List[Dict]:
+    """Async variant of _try_dexscreener"""
+    try:
+        return _dexscreener_pairs_tokens(await _cached_aget(client, DEXSCREENER_PAIRS_URL, DEXSCREENER_HEADERS, PRICE_CACHE_TTL))
+    except Exception as e:
+        print(f"DexScreener API error: {e}", file=sys.stderr)
+    return []
+
+
+async def fetch_real_token_data_async() -> List[Dict]:
+    """
+    Query Gecko Terminal and DexScreener at once and return the first source, in priority order,
+    that has tokens; a DexScreener answer is only used once Gecko Terminal has come back empty,
+    and whatever is still in flight is cancelled as soon as a winner is known
+    """
+    # Same three connection retries the requests adapter gives the synchronous path
+    transport = httpx.AsyncHTTPTransport(retries=3)
+    async with httpx.AsyncClient(timeout=10.0, transport=transport) as client:
+        tasks = [asyncio.create_task(_try_gecko_async(client)), asyncio.create_task(_try_dexscreener_async(client))]
         try:
-            result = subprocess.run(['python3', 'fetch_dexscreener.py'], 
-                                  capture_output=True, text=True, timeout=15)
-            if result.stdout.strip():
-                real_data = json.loads(result.stdout)
-                if real_data and len(real_data) > 0:
-                    print(f"✅ Fetched {len(real_data)} authentic tokens from API", file=sys.stderr)
-                    return real_data
-        except Exception as e:
-            print(f"Authentic data fetch error: {e}", file=sys.stderr)
-        
-        # Try enhanced token data system
+            for task in tasks:
+                tokens = await task
+                if tokens:
+                    return tokens
+            return []
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _try_live_apis() -> List[Dict]:
+    """Gecko Terminal first, DexScreener as backup; both in flight together when httpx is available"""
+    if httpx is not None:
         try:
-            result = subprocess.run(['python3', 'enhanced_token_data.py'], 
-                                  capture_output=True, text=True, timeout=15)
-            if result.stdout.strip():
-                enhanced_data = json.loads(result.stdout)
-                if enhanced_data and len(enhanced_data) > 0:
-                    print(f"✅ Fetched {len(enhanced_data)} enhanced tokens", file=sys.stderr)
-                    return enhanced_data
-        except Exception as e:
-            print(f"Enhanced data fetch error: {e}", file=sys.stderr)
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop running in this thread, so asyncio.run can own one
+            try:
+                return asyncio.run(fetch_real_token_data_async())
+            except Exception as e:
+                print(f"Concurrent API fetch error: {e}", file=sys.stderr)
+                return []
+    
+    # Without httpx, or when called from inside a running event loop, query the sources one by one
+    return _try_gecko() or _try_dexscreener()
+
+
+def _try_authentic_fetcher() -> List[Dict]:
+    """Tokens from the separate fetch_dexscreener fetcher"""
+    try:
+        real_data = run_script('fetch_dexscreener.py', timeout=15)
+        if real_data:
+            print(f"✅ Fetched {len(real_data)} authentic tokens from API", file=sys.stderr)
+            return real_data
+    except Exception as e:
+        print(f"Authentic data fetch error: {e}", file=sys.stderr)
+    return []
+
+
+def _try_enhanced_fetcher() -> List[Dict]:
+    """Tokens from the enhanced token data system"""
+    try:
+        enhanced_data = run_fetcher('enhanced_token_data', 'get_enhanced_hyperevm_tokens', 'enhanced_token_data.py', timeout=15)
+        if enhanced_data:
+            print(f"✅ Fetched {len(enhanced_data)} enhanced tokens", file=sys.stderr)
+            return enhanced_data
+    except Exception as e:
+        print(f"Enhanced data fetch error: {e}", file=sys.stderr)
+    return []
+
+
+# Token sources in priority order; each returns [] on failure and later ones only run when earlier ones come back empty
+_SOURCES = (_try_live_apis, _try_authentic_fetcher, _try_enhanced_fetcher)
+
+
+def fetch_real_token_data() -> List[Dict]:
+    """
+    Fetch real HyperEVM token data from Gecko Terminal API and HyperSwap routers
+    """
+    try:
+        for source in _SOURCES:
+            tokens = source()
+            if tokens:
+                return tokens
         
         # Final fallback to simulated real-time data
         return generate_router_based_data()
@@ -221,100 +447,112 @@ def fetch_real_token_data() -> List[Dict]:
         return generate_router_based_data()
 
 
-def parse_gecko_terminal_data(pools_data: List[Dict]) -> List[Dict]:
+def _gecko_pool_token(pool: Dict, now: float) -> Optional[Dict]:
     """
-    Parse Gecko Terminal API data into our token format
+    One Gecko Terminal pool as a token dict, or None when it is not a usable HYPE pair
     """
-    tokens = []
-    seen_symbols = set()
+    # Every access sits inside the try so one malformed pool is skipped instead of failing the whole listing
+    try:
+        attrs = pool.get('attributes') or {}
+        base_token = attrs.get('base_token') or {}
+        
+        # Focus on HYPE pairs
+        if (attrs.get('quote_token') or {}).get('symbol') not in HYPE_SYMBOLS:
+            return None
+        symbol = base_token.get('symbol', 'UNKNOWN')
+        if symbol in HYPE_SYMBOLS:
+            return None
+        
+        price = float(attrs['base_token_price_usd'])
+        change_24h = float(attrs['price_change_percentage']['h24'])
+        volume_24h = int(float(attrs['volume_usd']['h24']))
+        liquidity = int(float(attrs['reserve_in_usd']))
+        market_cap = to_int(attrs, 'market_cap_usd')  # often null for young pools
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        print(f"Error parsing Gecko pool data: {e}", file=sys.stderr)
+        return None
     
-    for pool in pools_data:
-        try:
-            attrs = pool['attributes']
-            base_token = attrs['base_token']
-            quote_token = attrs['quote_token']
-            
-            # Focus on HYPE pairs
-            if quote_token.get('symbol') in ['HYPE', 'WHYPE']:
-                symbol = base_token.get('symbol', 'UNKNOWN')
-                
-                if symbol not in seen_symbols and symbol not in ['HYPE', 'WHYPE']:
-                    price = float(attrs['base_token_price_usd'])
-                    change_24h = float(attrs['price_change_percentage']['h24'])
-                    volume_24h = int(float(attrs['volume_usd']['h24']))
-                    liquidity = int(float(attrs['reserve_in_usd']))
-                    
-                    tokens.append({
-                        "symbol": symbol,
-                        "name": base_token.get('name', symbol),
-                        "price": price,
-                        "price_str": f"${price:.8f}",
-                        "change_24h": change_24h,
-                        "volume_24h": volume_24h,
-                        "market_cap": int(float(attrs.get('market_cap_usd', 0))),
-                        "liquidity": liquidity,
-                        "pair": f"{symbol}/HYPE",
-                        "timestamp": time.time(),
-                        "last_trade": time.time() - random.randint(1, 300),
-                        "router": "HyperSwap",
-                        "contract_address": base_token.get('address', ''),
-                        "pool_address": pool['id'].split('_')[1] if '_' in pool['id'] else pool['id']
-                    })
-                    
-                    seen_symbols.add(symbol)
-                    
-        except Exception as e:
-            print(f"Error parsing Gecko pool data: {e}", file=sys.stderr)
-            continue
+    pool_id = pool.get('id', '')
+    return {
+        "symbol": symbol,
+        "name": base_token.get('name', symbol),
+        "price": price,
+        "price_str": _fmt_price(price),
+        "change_24h": change_24h,
+        "volume_24h": volume_24h,
+        "market_cap": market_cap,
+        "liquidity": liquidity,
+        "pair": f"{symbol}/HYPE",
+        "timestamp": now,
+        "last_trade": now - random.randint(1, 300),
+        "router": "HyperSwap",
+        "contract_address": base_token.get('address', ''),
+        "pool_address": pool_id.split('_')[1] if '_' in pool_id else pool_id
+    }
+
+def _dexscreener_pair_token(pair: Dict, now: float) -> Optional[Dict]:
+    """
+    One DexScreener pair as a token dict, or None when it is not a usable HYPE pair
+    """
+    # Every access sits inside the try so one malformed pair is skipped instead of failing the whole listing
+    try:
+        base_token = pair.get('baseToken')
+        quote_token = pair.get('quoteToken')
+        
+        # Include HYPE/WHYPE pairs
+        if base_token is None or quote_token is None or quote_token.get('symbol') not in HYPE_SYMBOLS:
+            return None
+        symbol = base_token.get('symbol', 'UNKNOWN')
+        if symbol in HYPE_SYMBOLS:
+            return None
+        
+        get = pair.get
+        price = to_float(pair, 'priceUsd')
+        change_24h = to_float(get('priceChange'), 'h24')
+        volume_24h = to_int(get('volume'), 'h24')
+        liquidity = to_int(get('liquidity'), 'usd')
+        market_cap = to_int(pair, 'marketCap')
+    except (AttributeError, TypeError, ValueError) as e:
+        print(f"Error parsing pair data: {e}", file=sys.stderr)
+        return None
     
-    return tokens
+    return {
+        "symbol": symbol,
+        "name": base_token.get('name', symbol),
+        "price": price,
+        "price_str": _fmt_price(price),
+        "change_24h": change_24h,
+        "volume_24h": volume_24h,
+        "market_cap": market_cap,
+        "liquidity": liquidity,
+        "pair": f"{symbol}/HYPE",
+        "timestamp": now,
+        "last_trade": now - random.randint(1, 300),
+        "router": "HyperSwap",
+        "contract_address": base_token.get('address', '')
+    }
+
+def _first_per_symbol(tokens) -> List[Dict]:
+    """Drop None entries and keep the first token seen for each symbol, in order"""
+    by_symbol = {}
+    for token in tokens:
+        if token is not None:
+            by_symbol.setdefault(token['symbol'], token)
+    return list(by_symbol.values())
+
+def parse_gecko_terminal_data(pools_data: List[Dict]) -> List[Dict]:
+    """
+    Parse Gecko Terminal API data into our token format
+    """
+    now = time.time()
+    return _first_per_symbol(_gecko_pool_token(pool, now) for pool in pools_data)
 
 def parse_dexscreener_data(pairs_data: List[Dict]) -> List[Dict]:
     """
     Parse real DexScreener API data into our token format
     """
-    tokens = []
-    seen_symbols = set()
-    
-    for pair in pairs_data:
-        try:
-            if 'baseToken' in pair and 'quoteToken' in pair:
-                base_token = pair['baseToken']
-                quote_token = pair['quoteToken']
-                
-                # Include HYPE/WHYPE pairs
-                if quote_token.get('symbol') in ['HYPE', 'WHYPE']:
-                    symbol = base_token.get('symbol', 'UNKNOWN')
-                    
-                    if symbol not in seen_symbols and symbol not in ['HYPE', 'WHYPE']:
-                        price = float(pair.get('priceUsd', 0))
-                        change_24h = float(pair.get('priceChange', {}).get('h24', 0))
-                        volume_24h = int(float(pair.get('volume', {}).get('h24', 0)))
-                        liquidity = int(float(pair.get('liquidity', {}).get('usd', 0)))
-                        
-                        tokens.append({
-                            "symbol": symbol,
-                            "name": base_token.get('name', symbol),
-                            "price": price,
-                            "price_str": f"${price:.8f}",
-                            "change_24h": change_24h,
-                            "volume_24h": volume_24h,
-                            "market_cap": int(float(pair.get('marketCap', 0))),
-                            "liquidity": liquidity,
-                            "pair": f"{symbol}/HYPE",
-                            "timestamp": time.time(),
-                            "last_trade": time.time() - random.randint(1, 300),
-                            "router": "HyperSwap",
-                            "contract_address": base_token.get('address', '')
-                        })
-                        
-                        seen_symbols.add(symbol)
-                        
-        except Exception as e:
-            print(f"Error parsing pair data: {e}", file=sys.stderr)
-            continue
-    
-    return tokens
+    now = time.time()
+    return _first_per_symbol(_dexscreener_pair_token(pair, now) for pair in pairs_data)
 
 def generate_router_based_data() -> List[Dict]:
     """
@@ -347,35 +585,42 @@ def generate_router_based_data() -> List[Dict]:
         token_data = []
         current_time = time.time()
         
-        for token in base_tokens:
+        # Draw every token's market noise up front in one batch per field
+        n = len(base_tokens)
+        change_volatility = (_RNG.random(n) - 0.5) * 1.5  # ±0.75% change adjustment
+        volume_multiplier = _RNG.uniform(0.85, 1.25, n)  # More conservative volume variation
+        base_changes = np.array([token["base_change"] for token in base_tokens])
+        base_volumes = np.array([token["volume"] for token in base_tokens])
+        
+        current_changes = np.round(base_changes + change_volatility, 2).tolist()
+        current_volumes = (base_volumes * volume_multiplier).astype(np.int64).tolist()
+        liquidities = _RNG.integers(80000, 2500001, n).tolist()  # Enhanced liquidity range
+        last_trades = (current_time - _RNG.integers(1, 181, n)).tolist()  # More frequent trades
+        
+        for token, current_change, current_volume, liquidity, last_trade in zip(
+            base_tokens, current_changes, current_volumes, liquidities, last_trades
+        ):
             # Enhanced price calculation with router-based volatility
             router_address = HYPERSWAP_V2_ROUTER if token["router"] == "v2" else HYPERSWAP_V3_ROUTER
             
             # Attempt to get real price from router (simulated for now)
             router_price = get_token_price_from_router("", router_address)
             
-            # Use base price with realistic market volatility
-            price_volatility = (random.random() - 0.5) * 0.03  # ±1.5% realistic movement
-            change_volatility = (random.random() - 0.5) * 1.5  # ±0.75% change adjustment
-            volume_multiplier = random.uniform(0.85, 1.25)  # More conservative volume variation
-            
             # Use exact base price to match DexScreener
             current_price = token["base_price"]  # No volatility for consistent pricing
-            current_change = token["base_change"] + change_volatility
-            current_volume = int(token["volume"] * volume_multiplier)
             
             token_data.append({
                 "symbol": token["symbol"],
                 "name": token["name"],
                 "price": round(current_price, 8),
-                "price_str": f"${current_price:.8f}",
-                "change_24h": round(current_change, 2),
+                "price_str": _fmt_price(current_price),
+                "change_24h": current_change,
                 "volume_24h": current_volume,
                 "market_cap": token["mcap"],
-                "liquidity": random.randint(80000, 2500000),  # Enhanced liquidity range
+                "liquidity": liquidity,
                 "pair": f"{token['symbol']}/HYPE",
                 "timestamp": current_time,
-                "last_trade": current_time - random.randint(1, 180),  # More frequent trades
+                "last_trade": last_trade,
                 "router": f"HyperSwap {token['router'].upper()}",
                 "router_address": router_address,
                 "dex": "HyperSwap"
@@ -410,37 +655,21 @@ def generate_realistic_orderbook(price: float, symbol: str) -> Dict:
     """
     Generate realistic order book data based on token price
     """
-    import random
-    
     # Price ranges for orders
     price_increment = max(price * 0.0001, 0.00001)  # 0.01% increments minimum
+    offsets = _ORDER_LEVELS * price_increment
     
-    # Generate sell orders (asks) - above current price
-    sell_orders = []
-    for i in range(1, 9):  # 8 sell orders
-        order_price = price + (price_increment * i)
-        quantity = random.randint(500, 3000)
-        sell_orders.append({
-            "price": round(order_price, 8),
-            "quantity": f"{quantity:,}"
-        })
-    
-    # Generate buy orders (bids) - below current price  
-    buy_orders = []
-    for i in range(1, 9):  # 8 buy orders
-        order_price = price - (price_increment * i)
-        quantity = random.randint(500, 3000)
-        buy_orders.append({
-            "price": round(order_price, 8),
-            "quantity": f"{quantity:,}"
-        })
+    # 8 sell orders (asks) above and 8 buy orders (bids) below the current price, built column-wise
+    sell_prices = np.round(price + offsets, 8).tolist()
+    buy_prices = np.round(price - offsets, 8).tolist()
+    sell_quantities, buy_quantities = _RNG.integers(500, 3001, size=(2, len(_ORDER_LEVELS))).tolist()
     
     return {
-        "sells": sell_orders,
-        "buys": buy_orders,
+        "sells": [{"price": p, "quantity": f"{q:,}"} for p, q in zip(sell_prices, sell_quantities)],
+        "buys": [{"price": p, "quantity": f"{q:,}"} for p, q in zip(buy_prices, buy_quantities)],
         "current_price": round(price, 8)
     }
 
 if __name__ == "__main__":
     tokens = scrape_hyperevm_tokens()
-    print(json.dumps(tokens, indent=2))
\ No newline at end of file
+    emit_json(tokens, indent=True)
\ No newline at end of file